@@ -14,58 +14,96 @@ from .models import (
     Testimonial, ProductTestimonial, SiteBranding, ProductCards, RecentlyDeletedItem
 )
 
-admin.site.register(User)
-admin.site.register(Admin)
-admin.site.register(AdminRole)
-admin.site.register(AdminRoleMap)
-
-admin.site.register(Image)
-admin.site.register(Product)
-admin.site.register(ProductInventory)
-admin.site.register(ProductVariant)
-admin.site.register(VariantCombination)
-admin.site.register(Attribute)
-admin.site.register(ShippingInfo)
-admin.site.register(ProductSEO)
-admin.site.register(ProductTestimonial)
-admin.site.register(ProductCards)
-
-admin.site.register(Category)
-admin.site.register(CategoryImage)
-admin.site.register(SubCategory)
-admin.site.register(SubCategoryImage)
-admin.site.register(CategorySubCategoryMap)
-admin.site.register(ProductSubCategoryMap)
-
-admin.site.register(Orders)
-admin.site.register(OrderItem)
-admin.site.register(OrderDelivery)
-
-admin.site.register(Cart)
-admin.site.register(CartItem)
-
-admin.site.register(BlogPost)
-admin.site.register(BlogImage)
-admin.site.register(BlogComment)
-
-admin.site.register(Notification)
-admin.site.register(CallbackRequest)
-
-admin.site.register(HeroBanner)
-admin.site.register(HeroBannerImage)
-
-admin.site.register(DeletedItemsCache)
-admin.site.register(SiteSettings)
-admin.site.register(DashboardSnapshot)
-
-admin.site.register(ProductImage)
-
-admin.site.register(FirstCarousel)
-admin.site.register(FirstCarouselImage)
-admin.site.register(SecondCarousel)
-admin.site.register(SecondCarouselImage)
-
-admin.site.register(Testimonial)
-admin.site.register(AttributeSubCategory)
-admin.site.register(SiteBranding)
-admin.site.register(RecentlyDeletedItem)
\ No newline at end of file
+class FastAdmin(admin.ModelAdmin):
+    """
+    Shared base for the model registrations below. No blanket JOINs: admins
+    whose __str__/list_display follow a relation name it in list_select_related.
+    """
+    list_select_related = False
+
+
+_MODELS = (
+    User, Admin, AdminRole, AdminRoleMap,
+
+    Image, Product, ProductInventory, ProductVariant,
+    ShippingInfo, ProductSEO,
+
+    Category, CategoryImage, SubCategory, SubCategoryImage,
+
+    Orders, OrderDelivery,
+
+    Cart,
+
+    BlogPost, BlogImage,
+
+    Notification, CallbackRequest,
+
+    HeroBanner, HeroBannerImage,
+
+    DeletedItemsCache, SiteSettings, DashboardSnapshot,
+
+    FirstCarousel, FirstCarouselImage, SecondCarousel, SecondCarouselImage,
+
+    Testimonial, AttributeSubCategory, SiteBranding, RecentlyDeletedItem,
+)
+
+for _model in _MODELS:
+    admin.site.register(_model, FastAdmin)
+
+
+# Relation-heavy models: explicit changelists that JOIN the FKs they display.
+@admin.register(Attribute)
+class AttributeAdmin(FastAdmin):
+    list_select_related = ("product", "parent")  # __str__ reads product.title / parent.name
+
+
+@admin.register(ProductTestimonial)
+class ProductTestimonialAdmin(FastAdmin):
+    list_select_related = ("product", "subcategory")  # __str__ shows the linked target
+
+
+@admin.register(ProductCards)
+class ProductCardsAdmin(FastAdmin):
+    list_select_related = ("product",)
+
+
+@admin.register(OrderItem)
+class OrderItemAdmin(FastAdmin):
+    list_display = ("item_id", "order", "product", "quantity", "total_price", "created_at")
+    list_select_related = ("order", "product")
+
+
+@admin.register(CartItem)
+class CartItemAdmin(FastAdmin):
+    list_display = ("item_id", "cart", "product", "quantity", "subtotal")
+    list_select_related = ("cart", "product")
+
+
+@admin.register(ProductImage)
+class ProductImageAdmin(FastAdmin):
+    list_display = ("id", "product", "image", "is_primary", "created_at")
+    list_select_related = ("product", "image")
+
+
+@admin.register(ProductSubCategoryMap)
+class ProductSubCategoryMapAdmin(FastAdmin):
+    list_display = ("id", "product", "subcategory")
+    list_select_related = ("product", "subcategory")
+
+
+@admin.register(CategorySubCategoryMap)
+class CategorySubCategoryMapAdmin(FastAdmin):
+    list_display = ("id", "category", "subcategory")
+    list_select_related = ("category", "subcategory")
+
+
+@admin.register(VariantCombination)
+class VariantCombinationAdmin(FastAdmin):
+    list_display = ("combo_id", "variant", "price_override", "created_at")
+    list_select_related = ("variant",)
+
+
+@admin.register(BlogComment)
+class BlogCommentAdmin(FastAdmin):
+    list_display = ("comment_id", "blog", "name", "email", "created_at")
+    list_select_related = ("blog",)
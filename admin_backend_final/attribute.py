@@ -1,13 +1,16 @@
 # app/attributes_api.py
 # DRF backend for AttributeSubCategory – aligned with your frontend contract.
 
-import json
+import hashlib
 import uuid
 from typing import List, Tuple
 
-from django.db import transaction
-from django.db.models import Q
-from django.utils import timezone
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Q, Window
+from django.db.models.functions import Lower
+from django.http import HttpResponse
+from django.utils.http import parse_etags, quote_etag
 from django.utils.text import slugify
 
 from rest_framework import status
@@ -16,24 +19,33 @@ from rest_framework.views import APIView
 from typing import Optional
 from .models import AttributeSubCategory  # <- model added earlier
 from .permissions import FrontendOnlyPermission
+from .renderers import OrjsonRenderer, dumps
 
 
 # ------------------------------
 # Helpers
 # ------------------------------
+_TYPES = frozenset({"size", "color", "material", "custom"})
+_STATUSES = frozenset({"visible", "hidden"})
+_EDITABLE_FIELDS = ("name", "slug", "type", "status", "description", "values", "subcategory_ids")
+
 def _ensure_unique_slug(base_slug: Optional[str]) -> str:
     """
     Ensure slug uniqueness across AttributeSubCategory by suffixing -2, -3, ...
+    One indexed query fetches every conflicting slug; the free suffix is picked in Python.
     """
     slug = base_slug or "attr"
-    if not AttributeSubCategory.objects.filter(slug=slug).exists():
+    taken = set(
+        AttributeSubCategory.objects
+        .filter(Q(slug=slug) | Q(slug__startswith=f"{slug}-"))
+        .values_list("slug", flat=True)
+    )
+    if slug not in taken:
         return slug
     i = 2
-    while True:
-        candidate = f"{slug}-{i}"
-        if not AttributeSubCategory.objects.filter(slug=candidate).exists():
-            return candidate
+    while f"{slug}-{i}" in taken:
         i += 1
+    return f"{slug}-{i}"
 
 def _normalize_values(values):
     if values is None:
@@ -42,31 +54,35 @@ def _normalize_values(values):
         return ([], "values must be a list")
 
     normalized = []
+    append = normalized.append
+    new_id = uuid.uuid4
+    _str, _float, _dict = str, float, dict   # hot names as locals
     default_count = 0
 
     for v in values:
-        if not isinstance(v, dict):
+        if not isinstance(v, _dict):
             return ([], "each value must be an object")
 
-        vid = str(v.get("id") or uuid.uuid4())
-        name = (v.get("name") or "").strip()
+        get = v.get
+        vid = _str(get("id") or new_id())
+        name = get("name")
+        name = name.strip() if name else ""
         if not name:
             return ([], "each value requires a non-empty 'name'")
 
-        pd = v.get("price_delta", None)
+        pd = get("price_delta")
         if pd is not None:
             try:
-                pd = float(pd)
+                pd = _float(pd)
             except Exception:
                 return ([], "price_delta must be numeric")
 
-        is_default = bool(v.get("is_default", False))
+        is_default = bool(get("is_default", False))
         if is_default:
             default_count += 1
-
-        image_url = (v.get("image_url") or "").strip()
-        image_id  = (v.get("image_id") or "").strip()   # ✅ new
-        desc = (v.get("description") or "").strip()
+            if default_count > 1:
+                # bail on the second default; no need to normalize the rest
+                return ([], "only one option can be marked as default")
 
         item = {
             "id": vid,
@@ -75,17 +91,18 @@ def _normalize_values(values):
         }
         if pd is not None:
             item["price_delta"] = pd
-        if image_url:
+
+        image_url = get("image_url")
+        if image_url and (image_url := image_url.strip()):
             item["image_url"] = image_url
-        if image_id:
+        image_id = get("image_id")
+        if image_id and (image_id := image_id.strip()):
             item["image_id"] = image_id                 # ✅ persist
-        if desc:
+        desc = get("description")
+        if desc and (desc := desc.strip()):
             item["description"] = desc
 
-        normalized.append(item)
-
-    if default_count > 1:
-        return ([], "only one option can be marked as default")
+        append(item)
 
     return (normalized, "")
 
@@ -94,7 +111,7 @@ def _normalize_sub_ids(sub_ids) -> Tuple[List[str], str]:
         return ([], "")
     if not isinstance(sub_ids, list):
         return ([], "subcategory_ids must be a list")
-    out = [str(x).strip() for x in sub_ids if str(x).strip()]
+    out = [s for x in sub_ids if (s := str(x).strip())]
     return (out, "")
 
 def _normalize_payload(obj: dict, *, is_create: bool) -> Tuple[dict, str]:
@@ -110,11 +127,11 @@ def _normalize_payload(obj: dict, *, is_create: bool) -> Tuple[dict, str]:
         return ({}, "name is required")
 
     type_ = (obj.get("type") or "custom").strip().lower()
-    if type_ not in {"size", "color", "material", "custom"}:
+    if type_ not in _TYPES:
         return ({}, "type must be one of: size, color, material, custom")
 
     status_val = (obj.get("status") or "visible").strip().lower()
-    if status_val not in {"visible", "hidden"}:
+    if status_val not in _STATUSES:
         return ({}, "status must be 'visible' or 'hidden'")
 
     values, v_err = _normalize_values(obj.get("values"))
@@ -125,12 +142,10 @@ def _normalize_payload(obj: dict, *, is_create: bool) -> Tuple[dict, str]:
     if s_err:
         return ({}, s_err)
 
-    raw_slug = (obj.get("slug") or slugify(name) or "attr").lower()
-    slug = raw_slug
-
-    # only ensure uniqueness on create or when user changed slug on edit
-    if is_create or (obj.get("slug") and AttributeSubCategory.objects.exclude(slug=raw_slug).filter(slug=raw_slug).exists()):
-        slug = _ensure_unique_slug(raw_slug)
+    # uniqueness is enforced by the DB constraint; views resolve collisions on IntegrityError
+    # slugify (NFKD + regex) only runs when the client didn't send a slug; it already lower-cases
+    raw_slug = (obj.get("slug") or "").strip()
+    slug = raw_slug.lower() if raw_slug else (slugify(name) or "attr")
 
     normalized = {
         # Use client id if present, else generate UUID (string)
@@ -148,13 +163,13 @@ def _normalize_payload(obj: dict, *, is_create: bool) -> Tuple[dict, str]:
 
 def _serialize_attribute(m: AttributeSubCategory) -> dict:
     clean_values = []
+    append = clean_values.append
     for val in (m.values or []):
-        if isinstance(val, dict):
-            # strip only image_data, leave image_id and image_url
-            clean = {k: v for k, v in val.items() if k != "image_data"}
-            clean_values.append(clean)
-        else:
-            clean_values.append(val)
+        # strip only image_data, leave image_id and image_url; copy only when needed
+        if isinstance(val, dict) and "image_data" in val:
+            val = {**val}
+            del val["image_data"]
+        append(val)
 
     return {
         "id": str(m.attribute_id),
@@ -162,24 +177,74 @@ def _serialize_attribute(m: AttributeSubCategory) -> dict:
         "slug": m.slug,
         "type": m.type,
         "status": m.status,
-        "description": getattr(m, "description", "") or "",
+        "description": m.description or "",
         "values": clean_values,
-        "created_at": m.created_at.isoformat(),
+        "created_at": m.created_at,  # encoded natively by the orjson renderer
         "subcategory_ids": m.subcategory_ids or [],
     }
 
+# ------------------------------
+# List response cache
+# ------------------------------
+# Serialized list pages are cached as (etag, raw JSON) pairs. Keys embed a
+# generation counter; mutating views bump it on commit, which orphans every
+# cached page at once without needing backend-specific pattern deletes.
+LIST_CACHE_NS = "attrsubcat:v2"
+LIST_CACHE_TTL = 60
+_LIST_CACHE_GEN = f"{LIST_CACHE_NS}:gen"
+
+def _list_cache_key(sub_id: str, page: int, page_size: int) -> str:
+    try:
+        gen = cache.get(_LIST_CACHE_GEN) or 0
+    except Exception:
+        gen = 0
+    return f"{LIST_CACHE_NS}:{gen}:{sub_id}:{page}:{page_size}"
+
+def _invalidate_list_cache() -> None:
+    try:
+        cache.incr(_LIST_CACHE_GEN)
+    except ValueError:
+        # counter missing/evicted: start a fresh generation
+        cache.set(_LIST_CACHE_GEN, 1, None)
+    except Exception:
+        pass
+
+def _list_etag(sig: dict, sub_id: str, page: int, page_size: int) -> str:
+    """Validator for one list page: changes whenever any row in the filter set is written/removed."""
+    raw = f"{sig['m']}-{sig['c']}-{sub_id}-{page}-{page_size}"
+    return quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+
+def _etag_matches(request, etag: str) -> bool:
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    tags = parse_etags(header)
+    return "*" in tags or etag in tags
+
+def _list_response(body, etag: str) -> HttpResponse:
+    resp = HttpResponse(body, content_type="application/json")
+    resp["ETag"] = etag
+    return resp
+
+def _not_modified(etag: str) -> HttpResponse:
+    resp = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+    resp["ETag"] = etag
+    return resp
+
 # ------------------------------
 # Views
 # ------------------------------
 class ShowSubcatAttributesAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
+    renderer_classes = [OrjsonRenderer]
 
     def get(self, request):
         """
         Optional filter: ?subcategory_id=<ID>
         Pagination: ?page=1&page_size=50
 
-        No DB ordering except PK; Python-sorts the small page by name.
+        Ordered case-insensitively by name in the DB (backed by a LOWER(name) index).
+        Sends an ETag; a matching If-None-Match gets 304 without serializing.
         """
         sub_id = (request.GET.get("subcategory_id") or "").strip()
 
@@ -195,81 +260,105 @@ class ShowSubcatAttributesAPIView(APIView):
         page_size = min(max(1, page_size), 200)
         offset = (page - 1) * page_size
 
+        cache_key = _list_cache_key(sub_id, page, page_size)
+        try:
+            cached = cache.get(cache_key)
+        except Exception:
+            cached = None
+        if cached is not None:
+            etag, body = cached
+            if _etag_matches(request, etag):
+                return _not_modified(etag)
+            return _list_response(body, etag)
+
         base = AttributeSubCategory.objects.all().order_by()
 
         if sub_id:
+            # containment branch is backed by the subcategory_ids index (migration 0049)
             base = base.filter(
                 Q(subcategory_ids__contains=[sub_id]) | Q(subcategory_ids=[])
             ).order_by()
 
-        total = base.count()
-
-        id_page = list(
-            base.order_by("attribute_id")
-                .values_list("attribute_id", flat=True)[offset : offset + page_size]
-        )
-
-        if not id_page:
-            return Response(
-                {"count": total, "page": page, "page_size": page_size, "results": []},
-                status=status.HTTP_200_OK,
+        # Page rows + total + last write in ONE round-trip: window aggregates
+        # (COUNT(*) OVER (), MAX(updated_at) OVER ()) are computed before LIMIT.
+        items = list(
+            base.annotate(
+                name_lc=Lower("name"),
+                _total=Window(expression=Count("*")),
+                _last_write=Window(expression=Max("updated_at")),
             )
+                .order_by("name_lc", "attribute_id")  # PK tie-break keeps OFFSET pages stable
+                .only(
+                    "attribute_id", "name", "slug", "type", "status",
+                    "description",               # NEW
+                    "values", "created_at", "subcategory_ids"
+                )[offset : offset + page_size]
+        )
+        if items:
+            sig = {"m": items[0]._last_write, "c": items[0]._total}
+        else:
+            # page past the end (or empty set): windows gave us nothing
+            sig = base.aggregate(m=Max("updated_at"), c=Count("*"))
 
-        objs = AttributeSubCategory.objects.only(
-            "attribute_id", "name", "slug", "type", "status",
-            "description",               # NEW
-            "values", "created_at", "subcategory_ids"
-        ).in_bulk(id_page, field_name="attribute_id")
-
-        items = [objs.get(aid) for aid in id_page if aid in objs and objs.get(aid)]
-        items.sort(key=lambda o: (o.name or "").lower())
+        etag = _list_etag(sig, sub_id, page, page_size)
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+        total = sig["c"]
 
         data = [_serialize_attribute(a) for a in items]
 
-        return Response(
-            {"count": total, "page": page, "page_size": page_size, "results": data},
-            status=status.HTTP_200_OK,
-        )
+        body = dumps({"count": total, "page": page, "page_size": page_size, "results": data})
+        try:
+            cache.set(cache_key, (etag, body), LIST_CACHE_TTL)
+        except Exception:
+            pass
+        return _list_response(body, etag)
 
 class SaveSubcatAttributesAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
+    renderer_classes = [OrjsonRenderer]
 
-    @transaction.atomic
     def post(self, request):
-        try:
-            payload = request.data if isinstance(request.data, dict) else json.loads(request.body.decode("utf-8") or "{}")
-        except Exception:
-            payload = {}
+        # Validation runs outside any transaction; only the INSERT is atomic.
+        # DRF has already parsed the body (malformed JSON -> 400 ParseError)
+        payload = request.data if isinstance(request.data, dict) else {}
 
         normalized, err = _normalize_payload(payload, is_create=True)
         if err:
             return Response({"error": err}, status=status.HTTP_400_BAD_REQUEST)
 
-        # If slug collides (race), re-ensure
-        if AttributeSubCategory.objects.filter(slug=normalized["slug"]).exists():
-            normalized["slug"] = _ensure_unique_slug(normalized["slug"])
-
-        obj = AttributeSubCategory.objects.create(
-            attribute_id=normalized["attribute_id"],
-            name=normalized["name"],
-            slug=normalized["slug"],
-            type=normalized["type"],
-            status=normalized["status"],
-            description=normalized["description"],  # NEW
-            values=normalized["values"],
-            subcategory_ids=normalized["subcategory_ids"],
-        )
+        fields = {
+            "attribute_id": normalized["attribute_id"],
+            "name": normalized["name"],
+            "slug": normalized["slug"],
+            "type": normalized["type"],
+            "status": normalized["status"],
+            "description": normalized["description"],  # NEW
+            "values": normalized["values"],
+            "subcategory_ids": normalized["subcategory_ids"],
+        }
+        try:
+            with transaction.atomic():
+                obj = AttributeSubCategory.objects.create(**fields)
+        except IntegrityError:
+            # Slug taken (unique constraint): resolve once and retry
+            fields["slug"] = _ensure_unique_slug(fields["slug"])
+            try:
+                with transaction.atomic():
+                    obj = AttributeSubCategory.objects.create(**fields)
+            except IntegrityError:
+                return Response({"error": "Attribute already exists"}, status=status.HTTP_409_CONFLICT)
+        transaction.on_commit(_invalidate_list_cache)
         return Response(_serialize_attribute(obj), status=status.HTTP_201_CREATED)
 
 class EditSubcatAttributesAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
+    renderer_classes = [OrjsonRenderer]
 
-    @transaction.atomic
     def put(self, request):
-        try:
-            payload = request.data if isinstance(request.data, dict) else json.loads(request.body.decode("utf-8") or "{}")
-        except Exception:
-            payload = {}
+        # Validation runs outside any transaction; only the UPDATE is atomic.
+        # DRF has already parsed the body (malformed JSON -> 400 ParseError)
+        payload = request.data if isinstance(request.data, dict) else {}
 
         obj_id = str(payload.get("id") or "").strip()
         if not obj_id:
@@ -284,34 +373,41 @@ class EditSubcatAttributesAPIView(APIView):
         if err:
             return Response({"error": err}, status=status.HTTP_400_BAD_REQUEST)
 
-        if normalized["slug"] != obj.slug and AttributeSubCategory.objects.exclude(attribute_id=obj.attribute_id).filter(slug=normalized["slug"]).exists():
-            normalized["slug"] = _ensure_unique_slug(normalized["slug"])
-
-        obj.name = normalized["name"]
-        obj.slug = normalized["slug"]
-        obj.type = normalized["type"]
-        obj.status = normalized["status"]
-        obj.description = normalized["description"]  # NEW
-        obj.values = normalized["values"]
-        obj.subcategory_ids = normalized["subcategory_ids"]
-        obj.updated_at = timezone.now()
-        obj.save()
+        # Write only the columns that actually changed (avoids rewriting large JSON blobs)
+        changed = [f for f in _EDITABLE_FIELDS if getattr(obj, f) != normalized[f]]
+        if changed:
+            for f in changed:
+                setattr(obj, f, normalized[f])
+            changed.append("updated_at")  # auto_now refreshes it on save
+            try:
+                with transaction.atomic():
+                    obj.save(update_fields=changed)
+            except IntegrityError:
+                # Slug taken by another attribute: resolve once and retry
+                obj.slug = _ensure_unique_slug(obj.slug)
+                try:
+                    with transaction.atomic():
+                        obj.save(update_fields=changed)
+                except IntegrityError:
+                    return Response({"error": "Slug already in use"}, status=status.HTTP_409_CONFLICT)
+            transaction.on_commit(_invalidate_list_cache)
 
         return Response(_serialize_attribute(obj), status=status.HTTP_200_OK)
 
 class DeleteSubcatAttributesAPIView(APIView):
   permission_classes = [FrontendOnlyPermission]
+  renderer_classes = [OrjsonRenderer]
 
   @transaction.atomic
   def post(self, request):
-      try:
-          data = request.data if isinstance(request.data, dict) else json.loads(request.body.decode("utf-8") or "{}")
-      except Exception:
-          data = {}
+      # DRF has already parsed the body (malformed JSON -> 400 ParseError)
+      data = request.data if isinstance(request.data, dict) else {}
       ids = data.get("ids", [])
       if not isinstance(ids, list) or not ids:
           return Response({"error": "No IDs provided"}, status=status.HTTP_400_BAD_REQUEST)
 
-      ids = [str(x).strip() for x in ids if str(x).strip()]
+      ids = [s for x in ids if (s := str(x).strip())]
       deleted, _ = AttributeSubCategory.objects.filter(attribute_id__in=ids).delete()
+      if deleted:
+          transaction.on_commit(_invalidate_list_cache)
       return Response({"success": True, "deleted": deleted}, status=status.HTTP_200_OK)
\ No newline at end of file
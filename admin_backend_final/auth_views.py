@@ -3,7 +3,6 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from django.views.decorators.csrf import ensure_csrf_cookie
 from django.http import JsonResponse
 from django.middleware.csrf import get_token
 from django.utils.decorators import method_decorator
@@ -15,11 +14,14 @@ COOKIE_SECURE = False     # set True in HTTPS/prod
 COOKIE_SAMESITE = "Lax"   # use "None" + SECURE=True if cross-site in prod
 COOKIE_MAX_AGE = 7 * 24 * 60 * 60
 
-@ensure_csrf_cookie
 def csrf(request):
     """
     GET /api/csrf/ -> sets csrftoken cookie and returns it as JSON
     Use this once on app load before making POSTs that need CSRF.
+
+    get_token() flags the cookie for CsrfViewMiddleware (global) to set on the
+    response, which is all @ensure_csrf_cookie did - except it also masked a
+    token of its own that was thrown away. One masking per request now.
     """
     return JsonResponse({"csrfToken": get_token(request)})
 
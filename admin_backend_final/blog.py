@@ -1,17 +1,26 @@
 # views/blog_views.py
 
 import json
+import re
 from uuid import uuid4
 import base64, mimetypes, os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime as _dt
+from functools import lru_cache
 from typing import Optional
-from django.db import transaction
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.core.files.storage import default_storage
+from django.db.models import OuterRef, Prefetch, Q, Subquery
+from django.http import FileResponse, Http404
+from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ParseError, UnsupportedMediaType
+from rest_framework.permissions import AllowAny
 
 from .models import (
     BlogPost,
@@ -30,62 +39,120 @@ from .utilities import save_image
 # Helpers
 # --------------------------
 
+_TRUE = frozenset({"true", "1", "yes", "on"})
+_FALSE = frozenset({"false", "0", "no", "off"})
+
 def parse_bool(val, default=False):
     """Consistent boolean parsing for 'true/false/1/0/yes/no/on/off'."""
     if val is None or val == "":
         return default
     s = str(val).strip().lower()
-    if s in ("true", "1", "yes", "on"):
+    if s in _TRUE:
         return True
-    if s in ("false", "0", "no", "off"):
+    if s in _FALSE:
         return False
     return default
 
+@lru_cache(maxsize=2048)
+def _slugify_cached(value: str) -> str:
+    return slugify(value)
+
+@lru_cache(maxsize=2048)
+def _guess_mime(name: str) -> str:
+    return mimetypes.guess_type(name)[0] or "image/jpeg"
+
+def _is_json(request) -> bool:
+    ct = request.content_type
+    return bool(ct and 'application/json' in ct)
+
 def generate_blog_id(title: str = "") -> str:
-    base = slugify(title).replace("-", "")[:18] if title else ""
+    base = _slugify_cached(title).replace("-", "")[:18] if title else ""
     return (base or "blog") + "-" + uuid4().hex[:10]
 
 def ensure_unique_slug(raw_slug: str, exclude_blog_id: str = None) -> str:
-    slug = slugify((raw_slug or "").strip()) or uuid4().hex[:8]
-    i = 2
-    q = BlogPost.objects.all()
+    slug = _slugify_cached((raw_slug or "").strip()) or uuid4().hex[:8]
+    # One query for `slug` and every `slug-N`, then probe -2, -3, ... in memory.
+    # (Not max(N) + 1: a post titled "foo-2024" must not push the next "foo" to "foo-2025".)
+    existing = BlogPost.objects.filter(slug__regex=rf"^{re.escape(slug)}(-[0-9]+)?$")
     if exclude_blog_id:
-        q = q.exclude(blog_id=exclude_blog_id)
-    while q.filter(slug=slug).exists():
-        slug = f"{slug}-{i}"
+        existing = existing.exclude(blog_id=exclude_blog_id)
+    taken = set(existing.values_list("slug", flat=True))
+    if slug not in taken:
+        return slug
+    i = 2
+    while f"{slug}-{i}" in taken:
         i += 1
-    return slug
+    return f"{slug}-{i}"
+
+def _slug_taken(blog: BlogPost) -> bool:
+    """After an IntegrityError: was it BlogPost.slug's unique constraint (vs. the PK or another one)?"""
+    return BlogPost.objects.filter(slug=blog.slug).exclude(blog_id=blog.blog_id).exists()
+
+# Files above this size are never inlined; the URL is returned instead.
+INLINE_IMAGE_MAX_BYTES = int(os.getenv("BLOG_INLINE_IMAGE_MAX_BYTES", str(2 * 1024 * 1024)))
+# Read size must be a multiple of 3 so per-chunk base64 output concatenates cleanly.
+_B64_CHUNK = 57 * 1024
+
+def _encode_data_uri(path: str, name: str) -> str:
+    """Encodes in fixed-size chunks so we never hold raw bytes + a full b64 copy at once."""
+    buf = bytearray(b"data:%s;base64," % _guess_mime(name or "").encode("ascii"))
+    with open(path, "rb", buffering=0) as fh:
+        for chunk in iter(lambda: fh.read(_B64_CHUNK), b""):
+            buf += base64.b64encode(chunk)
+    return buf.decode("ascii")
 
 def _image_to_data_uri(img) -> Optional[str]:
-    """Try to return a data URI from Image.image_file; fallback to url."""
+    """
+    Try to return a data URI from Image.image_file; fallback to url.
+    """
     if not img:
         return None
     f = getattr(img, "image_file", None)
     try:
-        if f and hasattr(f, "path") and os.path.exists(f.path):
-            with open(f.path, "rb") as fh:
-                raw = fh.read()
-            mime, _ = mimetypes.guess_type(f.name or "")
-            mime = mime or "image/jpeg"
-            b64 = base64.b64encode(raw).decode("ascii")
-            return f"data:{mime};base64,{b64}"
+        if f and hasattr(f, "path") and os.path.getsize(f.path) <= INLINE_IMAGE_MAX_BYTES:
+            return _encode_data_uri(f.path, f.name)
     except Exception:
         pass
     return img.url or None
 
-def get_primary_thumbnail_url(blog: BlogPost) -> Optional[str]:
+def _file_thumbnail(name: Optional[str], inline: bool = True) -> Optional[str]:
+    """
+    Same result as _thumbnail() but from a stored file name (e.g. a Subquery
+    annotation), so no Image instance is needed.
+    """
+    if not name:
+        return None
+    if inline:
+        try:
+            path = default_storage.path(name)
+            if os.path.getsize(path) <= INLINE_IMAGE_MAX_BYTES:
+                return _encode_data_uri(path, name)
+        except Exception:
+            pass
+    try:
+        return default_storage.url(name) or None
+    except Exception:
+        return None
+
+def get_primary_thumbnail_url(blog: BlogPost, inline: bool = True) -> Optional[str]:
     """
     Returns a data URI (base64) for the primary image if available,
     otherwise the first image. Falls back to .url if the file cannot be read.
+    inline=False returns the media URL without touching disk.
     """
     rel = (blog.images.select_related("image").filter(is_primary=True).first()
            or blog.images.select_related("image").first())
-    if not rel or not rel.image:
+    return _thumbnail(rel.image if rel else None, inline)
+
+def _thumbnail(img, inline: bool = True) -> Optional[str]:
+    if not img:
         return None
-    return _image_to_data_uri(rel.image)
+    if not inline:
+        return img.url or None
+    return _image_to_data_uri(img)
 
-@transaction.atomic
 def set_primary_image(blog: BlogPost, img: Image) -> None:
+    # Callers hold the request-level atomic; update_or_create adds its own savepoint
     BlogImage.objects.filter(blog=blog, is_primary=True).update(is_primary=False)
     BlogImage.objects.update_or_create(
         blog=blog,
@@ -93,8 +160,42 @@ def set_primary_image(blog: BlogPost, img: Image) -> None:
         defaults={"is_primary": True, "order": 0},
     )
 
-def _compute_status(draft: bool, publish_date):
-    now = timezone.now()
+def _reconcile_status(blogs) -> None:
+    """
+    Bring stored `status` in line with compute_status() (e.g. scheduled -> published
+    once publish_date passes). Fixes instances in memory; one bulk UPDATE for the stale ones.
+    """
+    stale = []
+    for b in blogs:
+        effective_status = b.compute_status()
+        if effective_status != (b.status or ""):
+            b.status = effective_status
+            stale.append(b)
+    if stale:
+        BlogPost.objects.bulk_update(stale, ["status"], batch_size=500)
+
+# No code path calls timezone.activate(), so the default zone is fixed for the process
+_TZ = timezone.get_current_timezone()
+
+def _parse_publish_date(raw):
+    """ISO-8601 string (Z/offset or naive) -> aware datetime; None if empty/invalid."""
+    if not raw:
+        return None
+    if isinstance(raw, _dt):
+        dt = raw
+    elif isinstance(raw, str):
+        try:
+            dt = _dt.fromisoformat(raw.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+    if timezone.is_naive(dt):
+        dt = timezone.make_aware(dt, _TZ)
+    return dt
+
+def _compute_status(draft: bool, publish_date, now=None):
+    now = now or timezone.now()
     if draft:
         return "draft"
     if publish_date and publish_date > now:
@@ -109,13 +210,11 @@ class SaveBlogAPIView(APIView):
 
     @transaction.atomic
     def post(self, request):
+        now = timezone.now()
         # Accept JSON or multipart
-        if request.content_type and 'application/json' in (request.content_type or ''):
-            try:
-                data = request.data if isinstance(request.data, dict) \
-                    else json.loads(request.body.decode('utf-8') or '{}')
-            except Exception:
-                data = {}
+        if _is_json(request):
+            # DRF has already parsed the body; don't decode/parse it a second time
+            data = request.data if hasattr(request.data, 'get') else {}
             files = {}
         else:
             data = request.POST
@@ -135,17 +234,8 @@ class SaveBlogAPIView(APIView):
         schema_enabled = parse_bool(data.get('schemaEnabled'), default=False)
         draft = parse_bool(data.get('draft'), default=False)
 
-        # --- robust publishDate parsing (handles Z/offset + naive) ---
         raw_pd = data.get('publishDate') or data.get('publish_date') or None
-        publish_date = None
-        if raw_pd:
-            try:
-                dt = timezone.datetime.fromisoformat(str(raw_pd).replace('Z', '+00:00'))
-                if timezone.is_naive(dt):
-                    dt = timezone.make_aware(dt, timezone.get_current_timezone())
-                publish_date = dt
-            except Exception:
-                publish_date = None
+        publish_date = _parse_publish_date(raw_pd)
 
         featured_image_data = files.get('featuredImage') or data.get('featuredImage') or None
 
@@ -164,11 +254,12 @@ class SaveBlogAPIView(APIView):
             blog = BlogPost(blog_id=generate_blog_id(title))
             created = True
 
-        # slug
-        if slug_in:
-            blog.slug = ensure_unique_slug(slug_in, exclude_blog_id=None if created else blog.blog_id)
-        elif created:
-            blog.slug = ensure_unique_slug(title, exclude_blog_id=None if created else blog.blog_id)
+        # slug: optimistic; the unique constraint catches collisions and we resolve on retry
+        slug_changed = False
+        if slug_in or created:
+            candidate = _slugify_cached((slug_in or title).strip()) or uuid4().hex[:8]
+            slug_changed = candidate != blog.slug
+            blog.slug = candidate
 
         # assign
         blog.title = title
@@ -182,13 +273,26 @@ class SaveBlogAPIView(APIView):
         blog.schema_enabled = schema_enabled
         blog.publish_date = publish_date
         blog.draft = draft
-        blog.status = _compute_status(blog.draft, blog.publish_date)
-        blog.updated_at = timezone.now()
-        if created:
-            blog.created_at = timezone.now()
-        blog.save()
+        # created_at/updated_at are auto_now_add/auto_now; the model stamps them on save()
+        blog.status = _compute_status(blog.draft, blog.publish_date, now=now)
+        try:
+            with transaction.atomic():
+                blog.save(force_insert=created)
+        except IntegrityError:
+            # Only a slug collision is ours to resolve; any other constraint propagates
+            if not (slug_changed and _slug_taken(blog)):
+                raise
+            blog.slug = ensure_unique_slug(blog.slug, exclude_blog_id=None if created else blog.blog_id)
+            try:
+                with transaction.atomic():
+                    blog.save(force_insert=created)
+            except IntegrityError:
+                if not _slug_taken(blog):
+                    raise
+                return Response({'error': 'Slug already exists'}, status=status.HTTP_409_CONFLICT)
 
         # image: save and force primary
+        primary_set = False
         if featured_image_data:
             img = save_image(
                 file_or_base64=featured_image_data,
@@ -200,8 +304,9 @@ class SaveBlogAPIView(APIView):
             )
             if img:
                 set_primary_image(blog, img)
+                primary_set = True
 
-        if not blog.images.filter(is_primary=True).exists():
+        if not primary_set and not blog.images.filter(is_primary=True).exists():
             first_rel = blog.images.select_related("image").first()
             if first_rel and first_rel.image:
                 set_primary_image(blog, first_rel.image)
@@ -229,48 +334,61 @@ class SaveBlogAPIView(APIView):
             'thumbnail': thumb or None
         }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
+_LIST_FIELDS = (
+    'blog_id', 'title', 'slug', 'author', 'status', 'created_at', 'updated_at',
+    'content_html', 'tags', 'meta_title', 'meta_description', 'og_title',
+    'og_image_url', 'draft', 'publish_date',
+)
+
 class ShowAllBlogsAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
     
     def get(self, request):
         now = timezone.now()
         include_all = str(request.query_params.get('all', '')).lower() in ('1','true','yes')
+        # Thumbnails are URLs by default; ?inline=1 restores base64 data URIs
+        inline = str(request.query_params.get('inline', '')).lower() in ('1','true','yes')
 
         qs = (BlogPost.objects.all() if include_all else
               BlogPost.objects.filter(draft=False).filter(
                   Q(publish_date__isnull=True) | Q(publish_date__lte=now)
               )).order_by('-created_at')
-
-        result = []
-        for b in qs:
-            effective_status = b.compute_status()
-            if effective_status != (b.status or ""):
-                BlogPost.objects.filter(pk=b.pk).update(status=effective_status)
-
-            thumb = get_primary_thumbnail_url(b)
-            status_label = effective_status.title()
-            created_str = b.created_at.date().isoformat() if b.created_at else ""
-            updated_str = b.updated_at.date().isoformat() if b.updated_at else ""
-
-            result.append({
-                'id': b.blog_id,
-                'title': b.title,
-                'slug': b.slug,
-                'thumbnail': thumb,
-                'author': b.author or "",
-                'category': 'General',
-                'status': status_label,
-                'created': created_str,
-                'updated': updated_str,
-                'content': b.content_html or "",
-
-                # 👇 NEW fields so the fallback isn’t lossy
-                'tags': b.tags or "",
-                'metaTitle': b.meta_title or "",
-                'metaDescription': b.meta_description or "",
-                'ogTitle': b.og_title or "",
-                'ogImage': b.og_image_url or "",
-            })
+        # Plain dicts with the thumbnail's file name joined in: a single query
+        rows = list(qs.annotate(primary_file=Subquery(
+            BlogImage.objects.filter(blog=OuterRef('pk'))
+            .order_by('-is_primary', 'order', 'id')
+            .values('image__image_file')[:1]
+        )).values(*_LIST_FIELDS, 'primary_file'))
+
+        # Same drift fix as _reconcile_status(): at most one UPDATE per status value
+        stale = {}
+        for r in rows:
+            effective_status = _compute_status(r['draft'], r['publish_date'], now=now)
+            if effective_status != (r['status'] or ""):
+                r['status'] = effective_status
+                stale.setdefault(effective_status, []).append(r['blog_id'])
+        for new_status, ids in stale.items():
+            BlogPost.objects.filter(blog_id__in=ids).update(status=new_status)
+
+        result = [{
+            'id': r['blog_id'],
+            'title': r['title'],
+            'slug': r['slug'],
+            'thumbnail': _file_thumbnail(r['primary_file'], inline),
+            'author': r['author'] or "",
+            'category': 'General',
+            'status': r['status'].title(),
+            'created': r['created_at'].date().isoformat() if r['created_at'] else "",
+            'updated': r['updated_at'].date().isoformat() if r['updated_at'] else "",
+            'content': r['content_html'] or "",
+
+            # 👇 NEW fields so the fallback isn’t lossy
+            'tags': r['tags'] or "",
+            'metaTitle': r['meta_title'] or "",
+            'metaDescription': r['meta_description'] or "",
+            'ogTitle': r['og_title'] or "",
+            'ogImage': r['og_image_url'] or "",
+        } for r in rows]
         return Response(result, status=status.HTTP_200_OK)
 
 # --------------------------
@@ -284,12 +402,9 @@ class EditBlogAPIView(APIView):
 
     @transaction.atomic
     def post(self, request, blog_id):
-        if request.content_type and 'application/json' in (request.content_type or ''):
-            try:
-                data = request.data if isinstance(request.data, dict) \
-                    else json.loads(request.body.decode('utf-8') or '{}')
-            except Exception:
-                data = {}
+        now = timezone.now()
+        if _is_json(request):
+            data = request.data if hasattr(request.data, 'get') else {}
             files = {}
         else:
             data = request.POST
@@ -342,19 +457,14 @@ class EditBlogAPIView(APIView):
             if pd is None or pd == "":
                 blog.publish_date = None
             else:
-                try:
-                    dt = timezone.datetime.fromisoformat(str(pd).replace('Z', '+00:00'))
-                    if timezone.is_naive(dt):
-                        dt = timezone.make_aware(dt, timezone.get_current_timezone())
-                    blog.publish_date = dt
-                except Exception:
-                    pass
-
-        blog.status = _compute_status(blog.draft, blog.publish_date)
-        blog.updated_at = timezone.now()
+                # unparseable input leaves the stored date untouched
+                blog.publish_date = _parse_publish_date(pd) or blog.publish_date
+
+        blog.status = _compute_status(blog.draft, blog.publish_date, now=now)
         blog.save()
 
         featured_image_data = files.get('featuredImage') or data.get('featuredImage') or None
+        primary_set = False
         if featured_image_data:
             img = save_image(
                 file_or_base64=featured_image_data,
@@ -366,8 +476,9 @@ class EditBlogAPIView(APIView):
             )
             if img:
                 set_primary_image(blog, img)
+                primary_set = True
 
-        if not blog.images.filter(is_primary=True).exists():
+        if not primary_set and not blog.images.filter(is_primary=True).exists():
             first_rel = blog.images.select_related("image").first()
             if first_rel and first_rel.image:
                 set_primary_image(blog, first_rel.image)
@@ -398,22 +509,26 @@ class DeleteBlogsAPIView(APIView):
 
     def _parse_json_body(self, request):
         try:
-            if request.content_type and 'application/json' in (request.content_type or ''):
-                if isinstance(request.data, dict):
-                    return request.data
-            body = request.body.decode('utf-8') if request.body else '{}'
-            return json.loads(body or '{}')
-        except Exception:
+            data = request.data
+        except UnsupportedMediaType:
+            # fetch() with a string body and no Content-Type sends text/plain;
+            # the body has always been read as JSON regardless of the header
+            try:
+                data = json.loads(request.body or b'{}')
+            except ValueError:
+                return {}
+        except ParseError:
             return {}
-
-    def _image_is_orphan(self, img):
-        return not (
-            BlogImage.objects.filter(image=img).exists() or
-            CategoryImage.objects.filter(image=img).exists() or
-            SubCategoryImage.objects.filter(image=img).exists() or
-            ProductImage.objects.filter(image=img).exists() or
-            Attribute.objects.filter(image=img).exists()
-        )
+        return data if hasattr(data, 'get') else {}
+
+    def _referenced_image_ids(self, ids):
+        """Subset of `ids` still linked from any image table (one query per table)."""
+        referenced = set()
+        for model in (BlogImage, CategoryImage, SubCategoryImage, ProductImage, Attribute):
+            referenced.update(
+                model.objects.filter(image_id__in=ids).values_list('image_id', flat=True).distinct()
+            )
+        return referenced
 
     @transaction.atomic
     def _delete_impl(self, data):
@@ -425,42 +540,31 @@ class DeleteBlogsAPIView(APIView):
         if not blog_ids:
             return Response({'error': 'No blog IDs provided'}, status=status.HTTP_400_BAD_REQUEST)
 
-        deleted, not_found = [], []
-        candidate_images, files_removed, images_removed = [], 0, 0
-
-        for bid in blog_ids:
-            try:
-                blog = BlogPost.objects.get(blog_id=bid)
-            except BlogPost.DoesNotExist:
-                not_found.append(bid)
-                continue
-
-            rels = list(BlogImage.objects.filter(blog=blog).select_related('image'))
-            imgs = [r.image for r in rels if r.image_id]
-            candidate_images.extend(imgs)
-
-            BlogImage.objects.filter(blog=blog).delete()
-            blog.delete()
-            deleted.append(bid)
-
-        seen = set()
-        for img in candidate_images:
-            if not img or img.image_id in seen:
-                continue
-            seen.add(img.image_id)
-
-            if self._image_is_orphan(img):
-                try:
-                    if getattr(img, 'image_file', None):
-                        try:
-                            img.image_file.delete(save=False)
-                            files_removed += 1
-                        except Exception:
-                            pass
-                    img.delete()
-                    images_removed += 1
-                except Exception:
-                    pass
+        found = set(BlogPost.objects.filter(blog_id__in=blog_ids).values_list('blog_id', flat=True))
+        deleted = [bid for bid in blog_ids if bid in found]
+        not_found = [bid for bid in blog_ids if bid not in found]
+        files_removed, images_removed = 0, 0
+
+        # Candidate image IDs (deduped) before the link rows go away
+        image_ids = set(
+            BlogImage.objects.filter(blog__blog_id__in=found).values_list('image_id', flat=True)
+        ) if found else set()
+
+        if found:
+            BlogImage.objects.filter(blog__blog_id__in=found).delete()
+            BlogPost.objects.filter(blog_id__in=found).delete()
+
+        orphans = image_ids - self._referenced_image_ids(list(image_ids)) if image_ids else set()
+        if orphans:
+            for img in Image.objects.filter(image_id__in=orphans).only('image_id', 'image_file'):
+                if getattr(img, 'image_file', None):
+                    try:
+                        img.image_file.delete(save=False)
+                        files_removed += 1
+                    except Exception:
+                        pass
+            _, per_model = Image.objects.filter(image_id__in=orphans).delete()
+            images_removed = per_model.get(Image._meta.label, 0)
 
         return Response({
             'success': True,
@@ -522,12 +626,8 @@ class SaveCommentsAPIView(APIView):
     @transaction.atomic
     def post(self, request):
         # Accept JSON or multipart/form
-        if request.content_type and "application/json" in (request.content_type or ""):
-            try:
-                data = request.data if isinstance(request.data, dict) \
-                    else json.loads(request.body.decode("utf-8") or "{}")
-            except Exception:
-                data = {}
+        if _is_json(request):
+            data = request.data if hasattr(request.data, "get") else {}
         else:
             data = request.POST
 
@@ -588,6 +688,8 @@ class ShowSpecificBlogAPIView(APIView):
         blog_id = (request.query_params.get("blog_id") or "").strip()
         slug = (request.query_params.get("slug") or "").strip()
         include_all = str(request.query_params.get("all", "")).lower() in ("1", "true", "yes")
+        # Opt-in: ?image_urls=1 links to BlogImageFileView instead of embedding base64 data URIs
+        as_urls = str(request.query_params.get("image_urls", "")).lower() in ("1", "true", "yes")
 
         if not blog_id and not slug:
             return Response({"error": "Provide blog_id or slug"}, status=status.HTTP_400_BAD_REQUEST)
@@ -602,17 +704,34 @@ class ShowSpecificBlogAPIView(APIView):
             now = timezone.now()
             qs = qs.filter(draft=False).filter(Q(publish_date__isnull=True) | Q(publish_date__lte=now))
 
-        blog = qs.first()
+        blog = qs.prefetch_related(Prefetch(
+            "images",
+            queryset=BlogImage.objects.select_related("image").order_by("order", "-is_primary", "pk"),
+            to_attr="_rels",
+        )).first()
         if not blog:
             return Response({"error": "Blog not found"}, status=status.HTTP_404_NOT_FOUND)
 
+        rels = [rel for rel in blog._rels if rel.image]
+        if as_urls:
+            # Link to the raw-bytes endpoint; the browser fetches/caches each image
+            uris = [
+                reverse("blog_image_file", kwargs={"blog_id": blog.blog_id, "image_id": rel.image_id})
+                for rel in rels
+            ]
+        elif len(rels) > 1:
+            # File reads release the GIL, so encode multi-image posts concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(rels))) as pool:
+                uris = list(pool.map(lambda rel: _image_to_data_uri(rel.image), rels))
+        else:
+            uris = [_image_to_data_uri(rel.image) for rel in rels]
+
         images_payload = []
-        rels = list(blog.images.select_related("image").order_by("order", "-is_primary", "pk"))
-        for rel in rels:
+        thumb = None
+        for rel, data_uri in zip(rels, uris):
             img = rel.image
-            if not img:
-                continue
-            data_uri = _image_to_data_uri(img)
+            if rel.is_primary and thumb is None:
+                thumb = data_uri
             images_payload.append({
                 "id": getattr(img, "image_id", None),
                 "url": data_uri,
@@ -620,12 +739,11 @@ class ShowSpecificBlogAPIView(APIView):
                 "is_primary": bool(rel.is_primary),
                 "order": rel.order if rel.order is not None else 0,
             })
+        # Same pick as get_primary_thumbnail_url (primary, else first) without re-reading the file
+        if thumb is None and uris:
+            thumb = uris[0]
 
-        thumb = get_primary_thumbnail_url(blog)
-
-        effective_status = blog.compute_status()
-        if effective_status != (blog.status or ""):
-            BlogPost.objects.filter(pk=blog.pk).update(status=effective_status)
+        _reconcile_status([blog])
 
         resp = {
             "id": blog.blog_id,
@@ -642,10 +760,36 @@ class ShowSpecificBlogAPIView(APIView):
             "schemaEnabled": bool(blog.schema_enabled),
             "publishDate": blog.publish_date.isoformat() if blog.publish_date else None,
             "draft": bool(blog.draft),
-            "status": effective_status,
+            "status": blog.status,
             "created_at": blog.created_at.isoformat() if blog.created_at else None,
             "updated_at": blog.updated_at.isoformat() if blog.updated_at else None,
             "thumbnail": thumb or None,
             "images": images_payload,
         }
         return Response(resp, status=status.HTTP_200_OK)
+
+
+class BlogImageFileView(APIView):
+    """
+    GET /api/blog/<blog_id>/image/<image_id>/
+    Streams the raw image bytes for a blog image (what ShowSpecificBlog?image_urls=1 links to).
+    <img src> can't send X-Frontend-Key, so anonymous callers get images of live posts
+    only (same rule as ShowSpecificBlog without ?all); the frontend key sees any post.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, blog_id, image_id):
+        qs = BlogImage.objects.select_related("image").filter(blog_id=blog_id, image_id=image_id)
+        if not FrontendOnlyPermission().has_permission(request, self):
+            qs = qs.filter(blog__draft=False).filter(
+                Q(blog__publish_date__isnull=True) | Q(blog__publish_date__lte=timezone.now())
+            )
+        rel = qs.first()
+        f = getattr(rel.image, "image_file", None) if rel else None
+        if not f:
+            raise Http404("Image not found")
+        try:
+            fh = f.open("rb")
+        except (FileNotFoundError, OSError):
+            raise Http404("Image not found")
+        return FileResponse(fh, content_type=_guess_mime(f.name or ""))
@@ -1,9 +1,8 @@
 # --- CallbackRequest API ------------------------------------------------------
-import json
 from datetime import timedelta
-from django.db import transaction
+from django.db import connection, transaction
+from django.http import StreamingHttpResponse
 from django.utils import timezone
-from django.core.exceptions import ValidationError
 from datetime import datetime, timezone as dt_timezone 
 from rest_framework import status
 from rest_framework.response import Response
@@ -12,7 +11,20 @@ from rest_framework.permissions import AllowAny
 from django.utils.dateparse import parse_datetime
 from .models import CallbackRequest
 from .permissions import FrontendOnlyPermission
+from .renderers import OrjsonRenderer, dumps, loads
+import math
 import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+try:
+    import ciso8601  # pip install ciso8601
+except Exception:
+    ciso8601 = None
+
+# Nothing calls timezone.activate(), so the project zone is fixed for the process
+_CURRENT_TZ = timezone.get_current_timezone()
+_UTC = dt_timezone.utc
 
 def _s(v, default=""):
     return (v if v is not None else default).strip() if isinstance(v, str) else (v if v is not None else default)
@@ -30,6 +42,9 @@ _DT_RE = re.compile(
     """,
     re.VERBOSE,
 )
+# Compact offsets (+0500) get normalised to +05:00; compiled once instead of per call
+_TZ_COMPACT_RE = re.compile(r"[+-]\d{4}")
+_TZ_COMPACT_TAIL_RE = re.compile(r"[+-]\d{4}$")
 
 def _parse_dt(value):
     """
@@ -41,14 +56,43 @@ def _parse_dt(value):
     s = str(value).strip()
     if not s:
         return None
+    return _parse_dt_str(s)
+
+@lru_cache(maxsize=2048)
+def _parse_dt_str(s):
+    """Pure on the stripped string (TZ is fixed at import), so retries/double-submits hit the cache."""
+    dt = None
+    if ciso8601 is not None:
+        # C parser: handles Z, fractional seconds and +HH:MM/+HHMM in one pass
+        try:
+            dt = ciso8601.parse_datetime(s)
+        except ValueError:
+            dt = None
+    if dt is None:
+        dt = _parse_iso_fallback(s)
+        if dt is None:
+            return None
 
-    m = _DT_RE.match(s.replace("z", "Z"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_CURRENT_TZ)  # zoneinfo (Django 4+): replace() is make_aware()
+    return dt.astimezone(_UTC)  # <-- use stdlib UTC
+
+def _parse_iso_fallback(s):
+    """Pure-Python path (no ciso8601, or inputs it rejects); may return a naive datetime."""
+    # Well-formed ISO strings go straight through CPython's C parser (3.11+ takes Z/+HHMM too);
+    # the regex normalisation below only runs for what it rejects.
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
+    m = _DT_RE.match(s if "z" not in s else s.replace("z", "Z"))
     if not m:
         try:
             s2 = s.replace(" ", "T")
             if s2.endswith("Z"):
                 s2 = s2[:-1] + "+00:00"
-            if re.search(r"[+-]\d{4}$", s2):  # +0500 → +05:00
+            # cheap char test first; the regex only confirms the rare +0500 → +05:00 case
+            if len(s2) >= 5 and s2[-5] in "+-" and _TZ_COMPACT_TAIL_RE.search(s2):
                 s2 = s2[:-2] + ":" + s2[-2:]
             try:
                 dt = datetime.fromisoformat(s2)
@@ -74,7 +118,7 @@ def _parse_dt(value):
 
         if tz == "Z":
             tz = "+00:00"
-        elif tz and re.fullmatch(r"[+-]\d{4}", tz):
+        elif tz and _TZ_COMPACT_RE.fullmatch(tz):
             tz = tz[:-2] + ":" + tz[-2:]
 
         norm = f"{date}T{hh}:{mm}:{ss}{frac}{tz}"
@@ -82,16 +126,12 @@ def _parse_dt(value):
             dt = datetime.fromisoformat(norm)
         except ValueError:
             dt = parse_datetime(norm)
-            if dt is None:
-                return None
+    return dt
 
-    if timezone.is_naive(dt):
-        dt = timezone.make_aware(dt, timezone.get_current_timezone())
-    return dt.astimezone(dt_timezone.utc)  # <-- use stdlib UTC
-    
 def _serialize_callback(obj: CallbackRequest):
     """
     Shape matches your FE: detail/list both consume these keys.
+    Datetimes stay as objects; OrjsonRenderer emits them as ISO-8601.
     """
     return {
         "id": obj.callback_id,
@@ -103,256 +143,314 @@ def _serialize_callback(obj: CallbackRequest):
         "event_venue": obj.event_venue or "",
         "approx_guest": obj.approx_guest if obj.approx_guest is not None else "",
         "status": obj.status,
-        "event_datetime": obj.event_datetime.isoformat() if obj.event_datetime else "",
+        "event_datetime": obj.event_datetime or "",
         "budget": obj.budget or "",
-        "preferred_callback": obj.preferred_callback.isoformat() if obj.preferred_callback else "",
+        "preferred_callback": obj.preferred_callback or "",
         "theme": obj.theme or "",
         "notes": obj.notes or "",
-        "created_at": obj.created_at.isoformat() if obj.created_at else "",
-        "updated_at": obj.updated_at.isoformat() if obj.updated_at else "",
+        "created_at": obj.created_at or "",
+        "updated_at": obj.updated_at or "",
     }
 
+_SEVEN_DAYS = timedelta(days=7)
+_SEVEN_DAY_ERROR = "Preferred call-back must be at least 7 days before the event date/time."
+
+_CALLBACK_FIELDS = (
+    "callback_id", "device_uuid", "username", "email", "phone_number", "event_type",
+    "event_venue", "approx_guest", "status", "event_datetime", "budget",
+    "preferred_callback", "theme", "notes", "created_at", "updated_at",
+)
+
+def _serialize_row_dict(d):
+    """_serialize_callback() for a .values(*_CALLBACK_FIELDS) row (no model instance)."""
+    return {
+        "id": d["callback_id"],
+        "device_uuid": d["device_uuid"],
+        "username": d["username"],
+        "email": d["email"] or "",
+        "phone_number": d["phone_number"],
+        "event_type": d["event_type"],
+        "event_venue": d["event_venue"] or "",
+        "approx_guest": d["approx_guest"] if d["approx_guest"] is not None else "",
+        "status": d["status"],
+        "event_datetime": d["event_datetime"] or "",
+        "budget": d["budget"] or "",
+        "preferred_callback": d["preferred_callback"] or "",
+        "theme": d["theme"] or "",
+        "notes": d["notes"] or "",
+        "created_at": d["created_at"] or "",
+        "updated_at": d["updated_at"] or "",
+    }
+
+def _stream_json(rows):
+    """
+    Encode a JSON array one row at a time: no 1000-item list in memory and the
+    first bytes go out before the last row is read.
+    """
+    yield b"["
+    it = iter(rows)
+    first = next(it, None)
+    if first is not None:
+        yield dumps(_serialize_row_dict(first))
+        for d in it:
+            yield b","
+            yield dumps(_serialize_row_dict(d))
+    yield b"]"
+
 def _validate_seven_day_rule(preferred_callback, event_datetime):
     """
     Server-side guard: preferred must be >= 7 days before event_datetime (if event set).
+    Returns False when the rule is violated.
     """
-    if event_datetime and preferred_callback:
-        if (event_datetime - preferred_callback) < timedelta(days=7):
-            raise ValidationError("Preferred call-back must be at least 7 days before the event date/time.")
+    return not (event_datetime and preferred_callback
+                and (event_datetime - preferred_callback) < _SEVEN_DAYS)
+
+_MAX_GUESTS = 2147483647  # PositiveIntegerField range that holds on every backend
+
+def _coerce_guests(raw):
+    """approx_guest -> int in [1, _MAX_GUESTS] or None; type checks instead of try/int()/except."""
+    if isinstance(raw, str):
+        # isdecimal, not isdigit: '²' is a digit int() rejects. The length cap keeps
+        # int() clear of the 4300-digit conversion limit (ValueError) and of overflow
+        if len(raw) > 10 or not raw.isdecimal():
+            return None
+        raw = int(raw)
+    elif isinstance(raw, float):
+        if not math.isfinite(raw):
+            return None
+        raw = int(raw)
+    elif isinstance(raw, int):
+        raw = int(raw)  # bool -> 0/1
+    else:
+        return None
+    return raw if 1 <= raw <= _MAX_GUESTS else None
+
+_VALID_STATUS = frozenset(("pending", "scheduled", "contacted", "completed", "cancelled"))
 
 def _first_non_blank(*vals, default=""):
     for v in vals:
-        if v is None:
-            continue
+        # str first: it's what JSON/form payloads almost always carry
         if isinstance(v, str):
-            s = v.strip()
-            if s != "":
-                return s
-        else:
+            v = v.strip()
+            if v:
+                return v
+        elif v is not None:
             return v
     return default
 
+# Optional free-text columns: stripped, "" when absent
+_STR_FIELDS = ("email", "event_venue", "budget", "theme", "notes")
+
+_REQUIRED_ERROR = "device_uuid, username, phone_number, event_type, preferred_callback are required"
+
+def _normalize_save_payload(data) -> Tuple[dict, Optional[str]]:
+    """
+    One pass over a create payload: returns (model kwargs, None) or ({}, error).
+    Cheap presence checks run before any datetime parsing so bad payloads bail early.
+    """
+    device_uuid = _first_non_blank(data.get("device_uuid"))
+    username    = _first_non_blank(data.get("username"), data.get("full_name"))
+    phone_number= _first_non_blank(data.get("phone_number"), data.get("phone"))
+    event_type  = _first_non_blank(data.get("event_type"))
+    preferred_callback_raw = data.get("preferred_callback")
+    if not (device_uuid and username and phone_number and event_type and preferred_callback_raw):
+        return {}, _REQUIRED_ERROR
+
+    preferred_callback = _parse_dt(preferred_callback_raw)
+    if preferred_callback is None:
+        return {}, "Invalid preferred_callback datetime."
+
+    event_datetime_raw = data.get("event_datetime")
+    event_datetime = _parse_dt(event_datetime_raw)
+    if event_datetime_raw not in (None, "", "null") and event_datetime is None:
+        return {}, "Invalid event_datetime datetime."
+
+    if not _validate_seven_day_rule(preferred_callback, event_datetime):
+        return {}, _SEVEN_DAY_ERROR
+
+    # approx_guest coercion
+    approx_guest = _coerce_guests(
+        _first_non_blank(data.get("approx_guest"), data.get("estimated_guests"), default=None)
+    )
+
+    fields = {k: (data.get(k) or "").strip() for k in _STR_FIELDS}
+    fields.update(
+        device_uuid=device_uuid,
+        username=username,
+        phone_number=phone_number,
+        event_type=event_type,
+        approx_guest=approx_guest,
+        event_datetime=event_datetime,
+        preferred_callback=preferred_callback,
+    )
+    return fields, None
+
 class SaveCallbackAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
+    renderer_classes = [OrjsonRenderer]
 
     def post(self, request):
-        data = request.data if isinstance(request.data, dict) else json.loads(request.body or "{}")
-
-        device_uuid = _first_non_blank(data.get("device_uuid"))
-        username    = _first_non_blank(data.get("username"), data.get("full_name"))
-        email       = (data.get("email") or "").strip()
-        phone_number= _first_non_blank(data.get("phone_number"), data.get("phone"))
-        event_type  = _first_non_blank(data.get("event_type"))
-        event_venue = (data.get("event_venue") or "").strip()
-        approx_guest_raw = _first_non_blank(data.get("approx_guest"), data.get("estimated_guests"), default=None)
-        budget      = (data.get("budget") or "").strip()
-
-        # Parse datetimes early and validate explicitly
-        preferred_callback_raw = data.get("preferred_callback")
-        event_datetime_raw     = data.get("event_datetime")
-
-        preferred_callback = _parse_dt(preferred_callback_raw)
-        if preferred_callback_raw and preferred_callback is None:
-            return Response({"error": "Invalid preferred_callback datetime."}, status=status.HTTP_400_BAD_REQUEST)
-
-        event_datetime = _parse_dt(event_datetime_raw)
-        if event_datetime_raw not in (None, "", "null") and event_datetime is None:
-            return Response({"error": "Invalid event_datetime datetime."}, status=status.HTTP_400_BAD_REQUEST)
-
-        theme       = (data.get("theme") or "").strip()
-        notes       = (data.get("notes") or "").strip()
-
-        # Requireds
-        if not (device_uuid and username and phone_number and event_type and preferred_callback):
-            return Response(
-                {"error": "device_uuid, username, phone_number, event_type, preferred_callback are required"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Seven-day rule
-        try:
-            _validate_seven_day_rule(preferred_callback, event_datetime)
-        except ValidationError as e:
-            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        data = request.data if isinstance(request.data, dict) else loads(request.body or b"{}")
 
-        # approx_guest coercion
-        approx_guest = None
-        if approx_guest_raw not in (None, "", "null"):
-            try:
-                approx_guest = int(approx_guest_raw)
-                if approx_guest < 1:
-                    approx_guest = None
-            except Exception:
-                approx_guest = None
-
-        with transaction.atomic():
-            cb = CallbackRequest(
-                callback_id=CallbackRequest.new_id(),
-                device_uuid=device_uuid,
-                username=username,
-                email=email,
-                phone_number=phone_number,
-                event_type=event_type,
-                event_venue=event_venue,
-                approx_guest=approx_guest,
-                event_datetime=event_datetime,
-                budget=budget,
-                preferred_callback=preferred_callback,
-                theme=theme,
-                notes=notes,
-                status="pending",
-            )
-            cb.clean()
-            cb.save()
+        fields, err = _normalize_save_payload(data)
+        if err:
+            return Response({"error": err}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Single INSERT: already atomic on its own, no savepoint needed.
+        # No cb.clean(): its only check (seven-day rule) already ran in the normaliser.
+        cb = CallbackRequest(callback_id=CallbackRequest.new_id(), status="pending", **fields)
+        cb.save(force_insert=True)  # fresh id: skip Django's UPDATE-then-INSERT probe
 
         return Response(_serialize_callback(cb), status=status.HTTP_201_CREATED)
 
+# One INSERT statement per request at most
+_BATCH_MAX = 500
+
+class SaveCallbackBatchAPIView(APIView):
+    """
+    POST { "items": [ <save-callback payload>, ... ] }
+    All-or-nothing: any invalid item -> 400 listing each failure by index;
+    otherwise every row is inserted with one bulk INSERT.
+    """
+    permission_classes = [FrontendOnlyPermission]
+    renderer_classes = [OrjsonRenderer]
+
+    def post(self, request):
+        data = request.data if isinstance(request.data, dict) else loads(request.body or b"{}")
+        items = data.get("items")
+        if not isinstance(items, list) or not items:
+            return Response({"error": "items must be a non-empty list"}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > _BATCH_MAX:
+            return Response({"error": f"at most {_BATCH_MAX} items per request"}, status=status.HTTP_400_BAD_REQUEST)
+
+        objs, errors = [], []
+        for i, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({"index": i, "error": "invalid payload"})
+                continue
+            fields, err = _normalize_save_payload(item)
+            if err:
+                errors.append({"index": i, "error": err})
+            elif not errors:
+                objs.append(CallbackRequest(callback_id=CallbackRequest.new_id(), status="pending", **fields))
+        if errors:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        CallbackRequest.objects.bulk_create(objs, batch_size=_BATCH_MAX)
+        return Response([_serialize_callback(cb) for cb in objs], status=status.HTTP_201_CREATED)
+
 class EditCallbackAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
+    renderer_classes = [OrjsonRenderer]
 
     def post(self, request):
-        data = request.data if isinstance(request.data, dict) else json.loads(request.body or "{}")
+        data = request.data if isinstance(request.data, dict) else loads(request.body or b"{}")
 
         cid = _first_non_blank(data.get("id"), data.get("callback_id"))
         if not cid:
             return Response({"error": "id is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        with transaction.atomic():
-            try:
-                cb = CallbackRequest.objects.select_for_update().get(callback_id=cid)
-            except CallbackRequest.DoesNotExist:
-                return Response({"error": "Callback not found"}, status=status.HTTP_404_NOT_FOUND)
-
-            # --- Gather incoming fields (optional on edit) ---
-            username       = _first_non_blank(data.get("username"), data.get("full_name"), default=None)
-            email          = (data.get("email") or None)
-            phone_number   = _first_non_blank(data.get("phone_number"), data.get("phone"), default=None)
-            event_type     = _first_non_blank(data.get("event_type"), default=None)
-            event_venue    = (data.get("event_venue") or None)
-            approx_guest_in= _first_non_blank(data.get("approx_guest"), data.get("estimated_guests"), default=None)
-            budget         = (data.get("budget") or None)
-            theme          = (data.get("theme") or None)
-            notes          = (data.get("notes") or None)
-            status_in      = (data.get("status") or "").strip().lower()
-
-            preferred_raw  = data.get("preferred_callback")
-            event_dt_raw   = data.get("event_datetime")
-
-            # --- Parse datetimes only if provided (empty/None means no change) ---
-            new_preferred = None
-            if preferred_raw not in (None, "", "null"):
-                new_preferred = _parse_dt(preferred_raw)
-                if new_preferred is None:
-                    return Response({"error": "Invalid preferred_callback datetime."}, status=status.HTTP_400_BAD_REQUEST)
-
-            new_event_dt = None
-            if event_dt_raw not in (None, "", "null"):
-                new_event_dt = _parse_dt(event_dt_raw)
-                if new_event_dt is None:
-                    return Response({"error": "Invalid event_datetime datetime."}, status=status.HTTP_400_BAD_REQUEST)
-
-            # --- Coerce approx_guest if present ---
-            approx_guest_val = None
-            approx_guest_provided = approx_guest_in not in (None, "", "null")
-            if approx_guest_provided:
-                try:
-                    approx_guest_val = int(approx_guest_in)
-                    if approx_guest_val < 1:
-                        approx_guest_val = None
-                except Exception:
-                    approx_guest_val = None
-
-            # Determine prospective values for 7-day rule check
-            preferred_candidate = new_preferred if new_preferred is not None else cb.preferred_callback
-            event_dt_candidate  = new_event_dt if new_event_dt is not None else cb.event_datetime
-
-            try:
-                _validate_seven_day_rule(preferred_candidate, event_dt_candidate)
-            except ValidationError as e:
-                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
-
-            # --- Apply updates (only provided fields) ---
-            update_fields = []
+        # --- Gather incoming fields (optional on edit) ---
+        username       = _first_non_blank(data.get("username"), data.get("full_name"), default=None)
+        phone_number   = _first_non_blank(data.get("phone_number"), data.get("phone"), default=None)
+        event_type     = _first_non_blank(data.get("event_type"), default=None)
+        approx_guest_in= _first_non_blank(data.get("approx_guest"), data.get("estimated_guests"), default=None)
+        status_in      = (data.get("status") or "").strip().lower()
 
-            if username is not None:
-                cb.username = username.strip()
-                update_fields.append("username")
+        preferred_raw  = data.get("preferred_callback")
+        event_dt_raw   = data.get("event_datetime")
 
-            if email is not None:
-                cb.email = (email or "").strip()
-                update_fields.append("email")
+        # --- Parse datetimes only if provided (empty/None means no change) ---
+        new_preferred = None
+        if preferred_raw not in (None, "", "null"):
+            new_preferred = _parse_dt(preferred_raw)
+            if new_preferred is None:
+                return Response({"error": "Invalid preferred_callback datetime."}, status=status.HTTP_400_BAD_REQUEST)
 
-            if phone_number is not None:
-                cb.phone_number = phone_number.strip()
-                update_fields.append("phone_number")
+        new_event_dt = None
+        if event_dt_raw not in (None, "", "null"):
+            new_event_dt = _parse_dt(event_dt_raw)
+            if new_event_dt is None:
+                return Response({"error": "Invalid event_datetime datetime."}, status=status.HTTP_400_BAD_REQUEST)
 
-            if event_type is not None:
-                cb.event_type = event_type.strip() or "Other"
-                update_fields.append("event_type")
+        # --- Coerce approx_guest if present ---
+        approx_guest_provided = approx_guest_in not in (None, "", "null")
+        approx_guest_val = _coerce_guests(approx_guest_in) if approx_guest_provided else None
 
-            if event_venue is not None:
-                cb.event_venue = event_venue.strip()
-                update_fields.append("event_venue")
+        # --- Collect updates (only provided fields) ---
+        # blank/absent free-text fields mean "no change"
+        changed = {k: v.strip() for k in _STR_FIELDS if (v := data.get(k))}
 
-            if approx_guest_provided:
-                cb.approx_guest = approx_guest_val
-                update_fields.append("approx_guest")
+        if username is not None:
+            changed["username"] = username.strip()
 
-            if new_event_dt is not None:
-                cb.event_datetime = new_event_dt
-                update_fields.append("event_datetime")
+        if phone_number is not None:
+            changed["phone_number"] = phone_number.strip()
 
-            if budget is not None:
-                cb.budget = (budget or "").strip()
-                update_fields.append("budget")
+        if event_type is not None:
+            changed["event_type"] = event_type.strip() or "Other"
 
-            if new_preferred is not None:
-                cb.preferred_callback = new_preferred
-                update_fields.append("preferred_callback")
+        if approx_guest_provided:
+            changed["approx_guest"] = approx_guest_val
 
-            if theme is not None:
-                cb.theme = (theme or "").strip()
-                update_fields.append("theme")
+        if new_event_dt is not None:
+            changed["event_datetime"] = new_event_dt
 
-            if notes is not None:
-                cb.notes = (notes or "").strip()
-                update_fields.append("notes")
+        if new_preferred is not None:
+            changed["preferred_callback"] = new_preferred
 
-            if status_in in {"pending", "scheduled", "contacted", "completed", "cancelled"}:
-                cb.status = status_in
-                update_fields.append("status")
+        if status_in in _VALID_STATUS:
+            changed["status"] = status_in
 
-            # Validate model-level clean (includes seven-day rule duplicate check)
-            cb.clean()
+        # Always bump updated_at (QuerySet.update() skips auto_now)
+        changed["updated_at"] = timezone.now()
+        rows = CallbackRequest.objects.filter(callback_id=cid)
 
-            # Always bump updated_at
-            if "updated_at" not in update_fields:
-                update_fields.append("updated_at")
-
-            cb.save(update_fields=update_fields or ["updated_at"])
+        if new_preferred is not None or new_event_dt is not None:
+            # Seven-day rule needs the stored counterpart: lock just those two columns
+            with transaction.atomic():
+                try:
+                    cur = rows.select_for_update().only("preferred_callback", "event_datetime").get()
+                except CallbackRequest.DoesNotExist:
+                    return Response({"error": "Callback not found"}, status=status.HTTP_404_NOT_FOUND)
+
+                preferred_candidate = new_preferred if new_preferred is not None else cur.preferred_callback
+                event_dt_candidate  = new_event_dt if new_event_dt is not None else cur.event_datetime
+                if not _validate_seven_day_rule(preferred_candidate, event_dt_candidate):
+                    return Response({"error": _SEVEN_DAY_ERROR}, status=status.HTTP_400_BAD_REQUEST)
+
+                rows.update(**changed)
+        elif not rows.update(**changed):
+            # Nothing cross-field to check: a single UPDATE, no row lock
+            return Response({"error": "Callback not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        return Response(_serialize_callback(cb), status=status.HTTP_200_OK)
+        try:
+            row = rows.values(*_CALLBACK_FIELDS).get()
+        except CallbackRequest.DoesNotExist:
+            # deleted between the UPDATE and this read
+            return Response({"error": "Callback not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(_serialize_row_dict(row), status=status.HTTP_200_OK)
  
 class DeleteCallbackAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
+    renderer_classes = [OrjsonRenderer]
 
     def post(self, request):
-        data = request.data if isinstance(request.data, dict) else json.loads(request.body or "{}")
+        data = request.data if isinstance(request.data, dict) else loads(request.body or b"{}")
         cid = _s(data.get("id")) or _s(data.get("callback_id"))
         if not cid:
             return Response({"error": "id is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            cb = CallbackRequest.objects.get(callback_id=cid)
-        except CallbackRequest.DoesNotExist:
+        # No get() first: the delete's row count tells us whether it existed
+        deleted, _ = CallbackRequest.objects.filter(callback_id=cid).delete()
+        if not deleted:
             return Response({"error": "Callback not found"}, status=status.HTTP_404_NOT_FOUND)
-
-        cb.delete()
         return Response({"message": "Callback deleted"}, status=status.HTTP_200_OK)
 
 
 class ShowSpecificCallbackAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
+    renderer_classes = [OrjsonRenderer]
 
     def get(self, request):
         cid = _s(request.query_params.get("id")) or _s(request.query_params.get("callback_id"))
@@ -367,6 +465,58 @@ class ShowSpecificCallbackAPIView(APIView):
         return Response(_serialize_callback(cb), status=status.HTTP_200_OK)
 
 
+@lru_cache(maxsize=None)
+def _list_sql(by_device: bool, by_status: bool) -> str:
+    """
+    SELECT for each of the four filter combinations, compiled by the ORM once per
+    process. Placeholders are filled in order: device_uuid, then status.
+    """
+    qs = CallbackRequest.objects.order_by("-created_at")
+    if by_device:
+        qs = qs.filter(device_uuid="")
+    if by_status:
+        qs = qs.filter(status="")
+    sql, _ = qs.values_list(*_CALLBACK_FIELDS)[:1000].query.sql_with_params()
+    return sql
+
+_DT_COLS = tuple(
+    i for i, f in enumerate(_CALLBACK_FIELDS)
+    if f in ("event_datetime", "preferred_callback", "created_at", "updated_at")
+)
+
+def _list_rows(sql, params):
+    """
+    Raw-cursor rows as .values()-style dicts (datetimes made aware like the ORM does).
+    The query and its first chunk run here, before the response starts streaming, so
+    a database error still fails the request instead of truncating a 200 body.
+    """
+    to_dt = getattr(connection.ops, "convert_datetimefield_value", None)
+
+    def as_dict(row):
+        if to_dt is not None:
+            row = list(row)
+            for i in _DT_COLS:
+                row[i] = to_dt(row[i], None, connection)
+        return dict(zip(_CALLBACK_FIELDS, row))
+
+    cur = connection.cursor()
+    try:
+        cur.execute(sql, params)
+        first = [as_dict(row) for row in cur.fetchmany(200)]
+    except Exception:
+        cur.close()
+        raise
+
+    def rest():
+        try:
+            yield from first
+            while chunk := cur.fetchmany(200):
+                for row in chunk:
+                    yield as_dict(row)
+        finally:
+            cur.close()
+    return rest()
+
 class ShowAllCallbackAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
 
@@ -376,15 +526,13 @@ class ShowAllCallbackAPIView(APIView):
           - device_uuid: only this device's rows
           - status: pending|scheduled|contacted|completed|cancelled
         """
-        qs = CallbackRequest.objects.all().order_by("-created_at")
-
         device_uuid = _s(request.query_params.get("device_uuid"))
         status_filter = _s(request.query_params.get("status")).lower()
+        by_status = status_filter in _VALID_STATUS
 
-        if device_uuid:
-            qs = qs.filter(device_uuid=device_uuid)
-        if status_filter in {"pending", "scheduled", "contacted", "completed", "cancelled"}:
-            qs = qs.filter(status=status_filter)
+        params = [device_uuid] if device_uuid else []
+        if by_status:
+            params.append(status_filter)
 
-        data = [_serialize_callback(x) for x in qs[:1000]]
-        return Response(data, status=status.HTTP_200_OK)
+        rows = _list_rows(_list_sql(bool(device_uuid), by_status), params)
+        return StreamingHttpResponse(_stream_json(rows), content_type="application/json")
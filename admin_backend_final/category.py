@@ -1,25 +1,187 @@
 # Standard Library
 import json
-import traceback
+import logging
 
 
 # Django
+from django.core.cache import cache
+from django.http import HttpResponse
 from django.utils import timezone
 from django.db import transaction
+from django.db.models import Case, Count, IntegerField, OuterRef, Prefetch, Subquery, Value, When
+from django.db.models.functions import Coalesce
 
 # Django REST Framework
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .utilities import generate_category_id, generate_subcategory_id, save_image
+from .utilities import generate_category_id, generate_subcategory_id, save_image, shared_cache_ttl
 # Local Imports
 from .models import *  # Consider specifying models instead of wildcard import
 from .permissions import FrontendOnlyPermission
+from .renderers import dumps
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# Catalog list cache
+# ------------------------------
+# The category/subcategory listings are cached as serialized JSON. Keys embed
+# a generation counter that signals.py bumps on commit whenever a catalog row
+# is saved or deleted; writes that bypass signals (queryset.update(),
+# bulk_create) call invalidate_catalog_cache() themselves.
+CATALOG_CACHE_NS = "catalog:v1"
+CATALOG_CACHE_TTL = 3600  # with a shared cache; see shared_cache_ttl() for the LocMemCache fallback
+_CATALOG_CACHE_GEN = f"{CATALOG_CACHE_NS}:gen"
+
+def _catalog_cache_key(kind: str) -> str:
+    try:
+        gen = cache.get(_CATALOG_CACHE_GEN) or 0
+    except Exception:
+        gen = 0
+    return f"{CATALOG_CACHE_NS}:{gen}:{kind}"
+
+def invalidate_catalog_cache() -> None:
+    try:
+        cache.incr(_CATALOG_CACHE_GEN)
+    except ValueError:
+        # counter missing/evicted: start a fresh generation
+        cache.set(_CATALOG_CACHE_GEN, 1, None)
+    except Exception:
+        pass
+
+def _cached_listing(kind: str, build) -> HttpResponse:
+    key = _catalog_cache_key(kind)
+    try:
+        body = cache.get(key)
+    except Exception:
+        body = None
+    if body is None:
+        body = dumps(build())
+        try:
+            cache.set(key, body, shared_cache_ttl(CATALOG_CACHE_TTL))
+        except Exception:
+            pass
+    return HttpResponse(body, content_type="application/json")
+
+
+def refresh_product_counts(subcategory_ids) -> None:
+    """Recompute SubCategory.product_count from the map table in one UPDATE."""
+    counts = (
+        ProductSubCategoryMap.objects.filter(subcategory=OuterRef('pk'))
+        .order_by().values('subcategory').annotate(c=Count('pk')).values('c')
+    )
+    SubCategory.objects.filter(subcategory_id__in=subcategory_ids).update(
+        product_count=Coalesce(Subquery(counts), 0)
+    )
+
+
+def refresh_product_counts_on_commit(subcategory_ids) -> None:
+    """
+    Queue subcategory ids for a single refresh_product_counts when the current
+    transaction commits, so a queryset delete of N map rows costs one UPDATE, not N.
+    """
+    conn = transaction.get_connection()
+    if not conn.in_atomic_block:
+        refresh_product_counts(subcategory_ids)
+        return
+    queued = getattr(conn, '_product_count_refresh', None)
+    # a rolled-back savepoint drops its callbacks, so only reuse a flush still queued
+    if queued is None or not any(hook[1] is queued[1] for hook in conn.run_on_commit):
+        ids = set()
+
+        def flush():
+            conn._product_count_refresh = None
+            refresh_product_counts(ids)
+
+        queued = conn._product_count_refresh = (ids, flush)
+        transaction.on_commit(flush)
+    queued[0].update(subcategory_ids)
+
+
+def _apply_order(model, pk_field, ordered):
+    """Write every item's order in a single UPDATE ... SET order = CASE pk WHEN ..."""
+    # dict keeps the last value for a repeated id, like the old per-item loop
+    orders = {item["id"]: item["order"] for item in ordered}
+    if not orders:
+        return
+    whens = [When(**{pk_field: pk}, then=Value(order)) for pk, order in orders.items()]
+    model.objects.filter(**{f"{pk_field}__in": list(orders)}).update(
+        order=Case(*whens, output_field=IntegerField())
+    )
+    transaction.on_commit(invalidate_catalog_cache)
+
+
+def _next_order(model):
+    """max(order) + 1, locking the current top row so concurrent saves don't share a slot.
+    Must run inside a transaction."""
+    top = (
+        model.objects.select_for_update()
+        .order_by('-order')
+        .values_list('order', flat=True)
+        .first()
+    )
+    return (top or 0) + 1
+
+
+def _drop_orphan_images(link_model, image_ids):
+    """Delete the Images in `image_ids` no longer bound through `link_model`, files included."""
+    if not image_ids:
+        return
+    still_bound = link_model.objects.filter(image_id__in=image_ids).values('image_id')
+    orphans = list(
+        Image.objects.filter(image_id__in=image_ids)
+        .exclude(image_id__in=still_bound)
+        .only('image_id', 'image_file')
+    )
+    for img in orphans:  # storage delete must be per-file
+        if getattr(img, 'image_file', None):
+            img.image_file.delete(save=False)
+    if orphans:
+        Image.objects.filter(image_id__in=[img.image_id for img in orphans]).delete()
+
+
+def _attach_image(link_model, owner, image_data, alt_text, tags, linked_table, linked_id):
+    """
+    Store an upload and make it the owner's image, dropping images it orphans.
+    Views register this with transaction.on_commit so the decode + storage
+    write runs after their row locks are released, not inside the transaction.
+    """
+    img = save_image(image_data, alt_text, tags, linked_table, "CategorySubCategoryPage", linked_id)
+    if not img:
+        # keep the current image rather than leave the row without one
+        raise ValueError(f"Image could not be stored for {linked_table} {linked_id}")
+    with transaction.atomic():
+        links = link_model.objects.filter(**owner)
+        old_image_ids = set(links.values_list('image_id', flat=True))
+        links.delete()
+        link_model.objects.create(image=img, **owner)
+        _drop_orphan_images(link_model, old_image_ids)
+
+
+def _attach_image_on_commit(payload, *args):
+    """
+    Run _attach_image once the view's transaction commits and record the outcome
+    in `payload`, the dict the view returns. The view's atomic block exits before
+    DRF renders the Response, so the flag still reaches the client.
+    """
+    def _run():
+        try:
+            _attach_image(*args)
+        except Exception:
+            logger.exception("Image upload failed for %s %s", args[4], args[5])
+            payload['image_saved'] = False
+            payload['image_error'] = 'Image upload failed; the previous image was kept'
+        else:
+            payload['image_saved'] = True
+    transaction.on_commit(_run)
+
 
 class SaveCategoryAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
 
+    @transaction.atomic
     def post(self, request):
         # Keep existing behavior: support both JSON and multipart
         if request.content_type and 'application/json' in request.content_type:
@@ -36,29 +198,34 @@ class SaveCategoryAPIView(APIView):
         if not name:
             return Response({'error': 'Name is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Keep original "replace existing with same name"
-        if Category.objects.filter(name=name).exists():
-            Category.objects.get(name=name).delete()
-
-        category_id = generate_category_id(name)
         now = timezone.now()
-        order = Category.objects.count() + 1
 
         # NEW: optional caption/description
         caption = (data.get('caption') or '').strip() or None
         description = (data.get('description') or '').strip() or None
 
-        category = Category.objects.create(
-            category_id=category_id,
-            name=name,
-            status='visible',
-            caption=caption,
-            description=description,
-            created_by='SuperAdmin',
-            created_at=now,
-            updated_at=now,
-            order=order
-        )
+        # Same name => update that row in place (keeps its id, order, maps and
+        # images) instead of cascading a delete and re-inserting everything
+        category = Category.objects.select_for_update().filter(name=name).first()
+        if category is None:
+            category = Category.objects.create(
+                category_id=generate_category_id(name),
+                name=name,
+                status='visible',
+                caption=caption,
+                description=description,
+                created_by='SuperAdmin',
+                created_at=now,
+                updated_at=now,
+                order=_next_order(Category)
+            )
+        else:
+            category.status = 'visible'
+            category.caption = caption
+            category.description = description
+            category.updated_at = now
+            category.save(update_fields=['status', 'caption', 'description', 'updated_at'])
+        category_id = category.category_id
 
         # Normalize alt text & tags
         alt_text = (
@@ -69,44 +236,57 @@ class SaveCategoryAPIView(APIView):
         # Image can be a file OR a base64 data URL string
         image_data = files.get('image') or data.get('image')
 
-        if image_data:
-            img = save_image(
-                file_or_base64=image_data,
-                alt_text=alt_text,
-                tags=tags,
-                linked_table="category",
-                linked_page="CategorySubCategoryPage",
-                linked_id=category_id
-            )
-            if img:
-                CategoryImage.objects.create(category=category, image=img)
-
-        return Response({
+        payload = {
             'success': True,
             'category_id': category_id,
             'caption': caption,
             'description': description
-        }, status=status.HTTP_201_CREATED)
+        }
+        if image_data:
+            # A re-save with a new image replaces the old one, like EditCategoryAPIView
+            _attach_image_on_commit(
+                payload, CategoryImage, {'category': category}, image_data, alt_text, tags, "category", category_id
+            )
+
+        return Response(payload, status=status.HTTP_201_CREATED)
 
 
 class ShowCategoryAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
 
     def get(self, request):
-        categories = Category.objects.all().order_by('order')
+        return _cached_listing("categories", self._build)
+
+    def _build(self):
+        # One query per relation instead of three per row
+        categories = (
+            Category.objects.order_by('order')
+            .only('category_id', 'name', 'status', 'order', 'caption', 'description')
+            .prefetch_related(
+                Prefetch(
+                    'categorysubcategorymap_set',
+                    queryset=CategorySubCategoryMap.objects.select_related('subcategory')
+                    .only('category', 'subcategory__subcategory_id', 'subcategory__name',
+                          'subcategory__product_count'),
+                    to_attr='sub_maps',
+                ),
+                Prefetch(
+                    'images',
+                    queryset=CategoryImage.objects.select_related('image').order_by('pk')
+                    .only('category', 'image__image_id', 'image__image_file', 'image__alt_text'),
+                    to_attr='prefetched_images',
+                ),
+            )
+        )
         result = []
 
         for cat in categories:
             # Subcategories mapped to this category
-            subcat_maps = CategorySubCategoryMap.objects.filter(category=cat).select_related('subcategory')
-            subcats = [m.subcategory for m in subcat_maps]
-            subcat_names = [s.name for s in subcats]
-
-            # Product count across those subcategories
-            product_count = ProductSubCategoryMap.objects.filter(subcategory__in=subcats).count()
+            subcat_names = [m.subcategory.name for m in cat.sub_maps]
+            product_count = sum(m.subcategory.product_count for m in cat.sub_maps)
 
             # First image (if any) + its alt text
-            rel = cat.images.select_related('image').first()
+            rel = cat.prefetched_images[0] if cat.prefetched_images else None
             img = rel.image if rel else None
             img_url = img.url if img else None
             alt_text = img.alt_text if img else ""
@@ -127,7 +307,7 @@ class ShowCategoryAPIView(APIView):
                 "description": cat.description,
             })
 
-        return Response(result, status=status.HTTP_200_OK)
+        return result
 
 
 class EditCategoryAPIView(APIView):
@@ -138,7 +318,7 @@ class EditCategoryAPIView(APIView):
         data = request.POST
         category_id = data.get('category_id')
         try:
-            category = Category.objects.select_related().get(category_id=category_id)
+            category = Category.objects.get(category_id=category_id)
         except Category.DoesNotExist:
             return Response({'error': 'Category not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -163,42 +343,29 @@ class EditCategoryAPIView(APIView):
             ''
         ).strip()
 
+        payload = {'success': True, 'message': 'Category updated'}
         image_data = request.FILES.get('image') or request.POST.get('image')
 
         if image_data:
-            # HARD REPLACE: remove old bindings & delete orphaned images/files
-            old_rels = CategoryImage.objects.filter(category=category).select_related('image')
-            old_images = [rel.image for rel in old_rels if rel.image_id]
-            # delete relations first
-            CategoryImage.objects.filter(category=category).delete()
-
-            # delete image files/records if no other relation uses them
-            for img in old_images:
-                if img and not CategoryImage.objects.filter(image=img).exists():
-                    if getattr(img, 'image_file', None):
-                        img.image_file.delete(save=False)  # delete file from storage
-                    img.delete()
-
-            # Save new image and bind
-            image = save_image(
-                image_data,
-                alt_text or "Alt-text",
-                data.get("tags", ""),
-                "category",
-                "CategorySubCategoryPage",
-                category_id
+            # HARD REPLACE: rebind to the new image & delete orphaned images/files
+            _attach_image_on_commit(
+                payload, CategoryImage, {'category': category}, image_data,
+                alt_text or "Alt-text", data.get("tags", ""), "category", category_id
             )
-            if image:
-                CategoryImage.objects.create(category=category, image=image)
         else:
             # No new image => just alt_text update on existing FIRST image
             if alt_text:
-                rel = category.images.select_related('image').first()
+                # one JOINed row, only the columns the alt-text write needs
+                rel = (
+                    category.images.select_related('image')
+                    .only('id', 'image__image_id', 'image__alt_text')
+                    .first()
+                )
                 if rel and rel.image:
                     rel.image.alt_text = alt_text
                     rel.image.save(update_fields=['alt_text'])
 
-        return Response({'success': True, 'message': 'Category updated'}, status=status.HTTP_200_OK)
+        return Response(payload, status=status.HTTP_200_OK)
     
 class DeleteCategoryAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
@@ -214,27 +381,28 @@ class DeleteCategoryAPIView(APIView):
         if not category_ids:
             return Response({'error': 'No category IDs provided'}, status=status.HTTP_400_BAD_REQUEST)
 
-        for category_id in category_ids:
-            try:
-                category = Category.objects.get(category_id=category_id)
-                related_mappings = CategorySubCategoryMap.objects.filter(category=category)
-
-                if not confirm and related_mappings.exists():
-                    return Response({
-                        'confirm': True,
-                        'message': 'Deleting this category will delete its subcategories and related products. Continue?'
-                    }, status=status.HTTP_200_OK)
-
-                for mapping in related_mappings:
-                    subcat = mapping.subcategory
-                    other_links = CategorySubCategoryMap.objects.filter(subcategory=subcat).exclude(category=category)
-                    if not other_links.exists():
-                        subcat.delete()
-                    mapping.delete()
-
-                category.delete()
-            except Category.DoesNotExist:
-                continue
+        cat_ids = set(category_ids)  # unknown IDs simply match nothing
+        sub_ids = set(
+            CategorySubCategoryMap.objects.filter(category_id__in=cat_ids)
+            .values_list('subcategory_id', flat=True)
+        )
+
+        if not confirm and sub_ids:
+            return Response({
+                'confirm': True,
+                'message': 'Deleting this category will delete its subcategories and related products. Continue?'
+            }, status=status.HTTP_200_OK)
+
+        with transaction.atomic():
+            if sub_ids:
+                # Subcategories whose only parents are in this batch go with them
+                kept = CategorySubCategoryMap.objects.filter(
+                    subcategory_id__in=sub_ids
+                ).exclude(category_id__in=cat_ids).values('subcategory_id')
+                SubCategory.objects.filter(subcategory_id__in=sub_ids).exclude(subcategory_id__in=kept).delete()
+
+            # Cascades take the remaining maps and CategoryImage rows
+            Category.objects.filter(category_id__in=cat_ids).delete()
 
         return Response({'success': True, 'message': 'Selected categories deleted'}, status=status.HTTP_200_OK)
 
@@ -246,8 +414,7 @@ class UpdateCategoryOrderAPIView(APIView):
         try:
             data = json.loads(request.body)
             ordered = data.get("ordered_categories", [])
-            for item in ordered:
-                Category.objects.filter(category_id=item["id"]).update(order=item["order"])
+            _apply_order(Category, "category_id", ordered)
             return Response({'success': True}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({'success': False, 'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -256,6 +423,7 @@ class UpdateCategoryOrderAPIView(APIView):
 class SaveSubCategoryAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
 
+    @transaction.atomic
     def post(self, request):
         data = request.POST
         name = (data.get('name') or '').strip()
@@ -264,8 +432,8 @@ class SaveSubCategoryAPIView(APIView):
         if not name or not category_ids:
             return Response({'error': 'Name and category_ids are required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        categories = Category.objects.filter(category_id__in=category_ids)
-        if not categories.exists():
+        categories = list(Category.objects.filter(category_id__in=category_ids).only('category_id'))
+        if not categories:
             return Response({'error': 'One or more category IDs not found'}, status=status.HTTP_400_BAD_REQUEST)
 
         # Duplicate subcategory name in same category
@@ -292,11 +460,13 @@ class SaveSubCategoryAPIView(APIView):
             updated_at=now,
             caption=caption,
             description=description,
-            order=SubCategory.objects.count() + 1
+            order=_next_order(SubCategory)
         )
 
-        for category in categories:
-            CategorySubCategoryMap.objects.create(category=category, subcategory=subcategory)
+        CategorySubCategoryMap.objects.bulk_create([
+            CategorySubCategoryMap(category=category, subcategory=subcategory)
+            for category in categories
+        ])
 
         # Normalize alt text
         alt_text = (
@@ -306,39 +476,54 @@ class SaveSubCategoryAPIView(APIView):
             ''
         ).strip()
 
-        image_data = request.FILES.get('image') or request.POST.get('image')
-        if image_data:
-            image = save_image(
-                image_data,
-                alt_text or "Alt-text",
-                data.get("tags", ""),
-                "subcategory",
-                "CategorySubCategoryPage",
-                subcategory_id
-            )
-            if image:
-                SubCategoryImage.objects.create(subcategory=subcategory, image=image)
-
-        return Response({
+        payload = {
             'success': True,
             'subcategory_id': subcategory_id,
             'caption': caption,
             'description': description
-        }, status=status.HTTP_201_CREATED)
+        }
+        image_data = request.FILES.get('image') or request.POST.get('image')
+        if image_data:
+            _attach_image_on_commit(
+                payload, SubCategoryImage, {'subcategory': subcategory}, image_data,
+                alt_text or "Alt-text", data.get("tags", ""), "subcategory", subcategory_id
+            )
+
+        return Response(payload, status=status.HTTP_201_CREATED)
 
 class ShowSubCategoryAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
 
     def get(self, request):
-        subcategories = SubCategory.objects.all().order_by("order")
+        return _cached_listing("subcategories", self._build)
+
+    def _build(self):
+        subcategories = (
+            SubCategory.objects.order_by("order")
+            .only('subcategory_id', 'name', 'status', 'order', 'caption', 'description', 'product_count')
+            .prefetch_related(
+                Prefetch(
+                    'categorysubcategorymap_set',
+                    queryset=CategorySubCategoryMap.objects.select_related('category')
+                    .only('subcategory', 'category__category_id', 'category__name'),
+                    to_attr='cat_maps',
+                ),
+                Prefetch(
+                    'images',
+                    queryset=SubCategoryImage.objects.select_related('image').order_by('pk')
+                    .only('subcategory', 'image__image_id', 'image__image_file', 'image__alt_text'),
+                    to_attr='prefetched_images',
+                ),
+            )
+        )
         result = []
         for sub in subcategories:
-            maps = CategorySubCategoryMap.objects.filter(subcategory=sub).select_related('category')
+            maps = sub.cat_maps
             category_names = [m.category.name for m in maps]
             category_ids = [m.category.category_id for m in maps]  # NEW
-            product_count = ProductSubCategoryMap.objects.filter(subcategory=sub).count()
+            product_count = sub.product_count
 
-            img_rel = sub.images.select_related('image').first()
+            img_rel = sub.prefetched_images[0] if sub.prefetched_images else None
             img = img_rel.image if img_rel else None
 
             result.append({
@@ -354,7 +539,7 @@ class ShowSubCategoryAPIView(APIView):
                 "description": sub.description,
                 "order": sub.order,
             })
-        return Response(result, status=status.HTTP_200_OK)
+        return result
 
 
 class EditSubCategoryAPIView(APIView):
@@ -365,7 +550,7 @@ class EditSubCategoryAPIView(APIView):
         data = request.POST
         subcategory_id = data.get('subcategory_id')
         try:
-            subcategory = SubCategory.objects.select_related().get(subcategory_id=subcategory_id)
+            subcategory = SubCategory.objects.get(subcategory_id=subcategory_id)
         except SubCategory.DoesNotExist:
             return Response({'error': 'SubCategory not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -388,14 +573,14 @@ class EditSubCategoryAPIView(APIView):
             if not new_cat_ids:
                 return Response({'error': 'At least one category is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-            categories_qs = Category.objects.filter(category_id__in=new_cat_ids)
-            if categories_qs.count() != len(new_cat_ids):
+            categories = list(Category.objects.filter(category_id__in=new_cat_ids).only('category_id'))
+            if len(categories) != len(new_cat_ids):
                 return Response({'error': 'One or more category IDs not found'}, status=status.HTTP_400_BAD_REQUEST)
 
             # Prevent duplicate name in same category (excluding self)
             effective_name = new_name or subcategory.name
             dup_exists = CategorySubCategoryMap.objects.filter(
-                category__in=categories_qs,
+                category__in=categories,
                 subcategory__name__iexact=effective_name
             ).exclude(subcategory=subcategory).exists()
             if dup_exists:
@@ -406,7 +591,7 @@ class EditSubCategoryAPIView(APIView):
 
             # Reconcile mappings
             existing_maps = CategorySubCategoryMap.objects.filter(subcategory=subcategory)
-            existing_ids = set(existing_maps.values_list('category__category_id', flat=True))
+            existing_ids = set(existing_maps.values_list('category_id', flat=True))  # FK column is Category's PK; no JOIN
 
             to_add = new_cat_ids - existing_ids
             to_remove = existing_ids - new_cat_ids
@@ -414,11 +599,11 @@ class EditSubCategoryAPIView(APIView):
             if to_remove:
                 CategorySubCategoryMap.objects.filter(
                     subcategory=subcategory,
-                    category__category_id__in=to_remove
+                    category_id__in=to_remove
                 ).delete()
 
             if to_add:
-                cats_to_add = {c.category_id: c for c in categories_qs if c.category_id in to_add}
+                cats_to_add = {c.category_id: c for c in categories if c.category_id in to_add}
                 CategorySubCategoryMap.objects.bulk_create([
                     CategorySubCategoryMap(category=cats_to_add[cid], subcategory=subcategory)
                     for cid in to_add
@@ -436,37 +621,27 @@ class EditSubCategoryAPIView(APIView):
             ''
         ).strip()
 
+        payload = {'success': True, 'message': 'SubCategory updated'}
         image_data = request.FILES.get('image') or request.POST.get('image')
 
         if image_data:
-            old_rels = SubCategoryImage.objects.filter(subcategory=subcategory).select_related('image')
-            old_images = [rel.image for rel in old_rels if rel.image_id]
-            SubCategoryImage.objects.filter(subcategory=subcategory).delete()
-
-            for img in old_images:
-                if img and not SubCategoryImage.objects.filter(image=img).exists():
-                    if getattr(img, 'image_file', None):
-                        img.image_file.delete(save=False)
-                    img.delete()
-
-            image = save_image(
-                image_data,
-                alt_text or "Alt-text",
-                data.get("tags", ""),
-                "subcategory",
-                "CategorySubCategoryPage",
-                subcategory_id
+            _attach_image_on_commit(
+                payload, SubCategoryImage, {'subcategory': subcategory}, image_data,
+                alt_text or "Alt-text", data.get("tags", ""), "subcategory", subcategory_id
             )
-            if image:
-                SubCategoryImage.objects.create(subcategory=subcategory, image=image)
         else:
             if alt_text:
-                rel = subcategory.images.select_related('image').first()
+                # one JOINed row, only the columns the alt-text write needs
+                rel = (
+                    subcategory.images.select_related('image')
+                    .only('id', 'image__image_id', 'image__alt_text')
+                    .first()
+                )
                 if rel and rel.image:
                     rel.image.alt_text = alt_text
                     rel.image.save(update_fields=['alt_text'])
 
-        return Response({'success': True, 'message': 'SubCategory updated'}, status=status.HTTP_200_OK)
+        return Response(payload, status=status.HTTP_200_OK)
 
 
 class DeleteSubCategoryAPIView(APIView):
@@ -484,48 +659,37 @@ class DeleteSubCategoryAPIView(APIView):
             return Response({'error': 'No subcategory IDs provided'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            for sub_id in set(subcategory_ids):  # de-duplicate IDs
-                print(f"Processing subcategory_id: {sub_id}")
-
-                try:
-                    subcat = SubCategory.objects.get(subcategory_id=sub_id)
-                except SubCategory.DoesNotExist:
-                    print(f"Subcategory {sub_id} not found.")
-                    continue
-
-                related_products = ProductSubCategoryMap.objects.filter(subcategory=subcat)
-
-                if not confirm and related_products.exists():
-                    return Response({
-                        'confirm': True,
-                        'message': f'Deleting subcategory "{sub_id}" will delete all its related products. Continue?'
-                    }, status=status.HTTP_200_OK)
-
-                for mapping in related_products:
-                    try:
-                        other_links = ProductSubCategoryMap.objects.filter(product=mapping.product).exclude(subcategory=subcat)
-                        if not other_links.exists():
-                            mapping.product.delete()
-                        mapping.delete()
-                    except Exception as e:
-                        print(f"Error while deleting mapping or product: {e}")
-
-                # Delete image relationships
-                try:
-                    SubCategoryImage.objects.filter(subcategory=subcat).delete()
-                except Exception as e:
-                    print(f"Error deleting SubCategoryImage for {sub_id}: {e}")
-
-                # Remove category-subcategory mapping
-                CategorySubCategoryMap.objects.filter(subcategory=subcat).delete()
-
-                # Finally, delete subcategory
-                subcat.delete()
+            sub_ids = set(subcategory_ids)  # de-duplicate IDs; unknown ones match nothing
+            links = list(
+                ProductSubCategoryMap.objects.filter(subcategory_id__in=sub_ids)
+                .values_list('subcategory_id', 'product_id')
+            )
+
+            if not confirm and links:
+                return Response({
+                    'confirm': True,
+                    'message': f'Deleting subcategory "{links[0][0]}" will delete all its related products. Continue?'
+                }, status=status.HTTP_200_OK)
+
+            product_ids = {pid for _, pid in links}
+
+            with transaction.atomic():
+                if product_ids:
+                    # Products linked only to subcategories in this batch go with them
+                    kept = ProductSubCategoryMap.objects.filter(
+                        product_id__in=product_ids
+                    ).exclude(subcategory_id__in=sub_ids).values('product_id')
+                    Product.objects.filter(pk__in=product_ids).exclude(pk__in=kept).delete()
+                    ProductSubCategoryMap.objects.filter(subcategory_id__in=sub_ids).delete()
+
+                SubCategoryImage.objects.filter(subcategory_id__in=sub_ids).delete()
+                CategorySubCategoryMap.objects.filter(subcategory_id__in=sub_ids).delete()
+                SubCategory.objects.filter(subcategory_id__in=sub_ids).delete()
 
             return Response({'success': True, 'message': 'Selected subcategories deleted successfully'}, status=status.HTTP_200_OK)
 
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("Subcategory delete failed for %s", subcategory_ids)
             return Response({'error': f'Unexpected error: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
@@ -536,13 +700,19 @@ class UpdateSubCategoryOrderAPIView(APIView):
         try:
             data = json.loads(request.body)
             ordered = data.get("ordered_subcategories", [])
-            for item in ordered:
-                SubCategory.objects.filter(subcategory_id=item["id"]).update(order=item["order"])
+            _apply_order(SubCategory, "subcategory_id", ordered)
             return Response({'success': True}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({'success': False, 'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+_ALLOWED_STATUSES = frozenset({'visible', 'hidden'})
+_STATUS_TARGETS = {
+    'categories': (Category, 'category_id'),
+    'subcategories': (SubCategory, 'subcategory_id'),
+}
+
+
 class UpdateHiddenStatusAPIView(APIView):
     permission_classes = [FrontendOnlyPermission]
 
@@ -556,12 +726,16 @@ class UpdateHiddenStatusAPIView(APIView):
             if not ids or not isinstance(ids, list):
                 return Response({'error': 'No valid IDs provided'}, status=status.HTTP_400_BAD_REQUEST)
 
-            if item_type == 'categories':
-                Category.objects.filter(category_id__in=ids).update(status=new_status)
-            elif item_type == 'subcategories':
-                SubCategory.objects.filter(subcategory_id__in=ids).update(status=new_status)
-            else:
+            target = _STATUS_TARGETS.get(item_type)
+            if target is None:
                 return Response({'error': 'Invalid type'}, status=status.HTTP_400_BAD_REQUEST)
+            if new_status not in _ALLOWED_STATUSES:
+                return Response({'error': 'Invalid status'}, status=status.HTTP_400_BAD_REQUEST)
+
+            model, pk_field = target
+            ids = list({str(i) for i in ids})  # dedupe to keep the IN list compact
+            model.objects.filter(**{f"{pk_field}__in": ids}).update(status=new_status)
+            transaction.on_commit(invalidate_catalog_cache)
 
             return Response({'success': True, 'message': f"{item_type.title()} status updated to {new_status}"}, status=status.HTTP_200_OK)
 
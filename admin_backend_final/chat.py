@@ -1,13 +1,14 @@
 # Back_End/admin_backend_final/chat.py
 from __future__ import annotations
-import os, json, uuid, math
+import os, json, uuid, math, heapq, hashlib, time, threading
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, List, Tuple, Optional
 
 from django.http import JsonResponse, HttpRequest
 from django.utils import timezone
 from django.core.cache import cache
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 
@@ -18,6 +19,7 @@ from rest_framework.views import APIView
 from rest_framework.renderers import JSONRenderer
 
 from .permissions import FrontendOnlyPermission
+from .utilities import shared_cache_ttl
 
 try:
     import groq  # pip install groq
@@ -26,7 +28,7 @@ except Exception:
 
 # Your models
 from .models import (
-    Category, ProductInventory, ProductVariant, ShippingInfo, SubCategory, Product,
+    Category, ProductVariant, SubCategory, Product,
     ProductSubCategoryMap, CategorySubCategoryMap, VariantCombination
 )
 
@@ -63,26 +65,64 @@ def _new_chatgroq(model: str) -> ChatGroq:
         temperature=0.2,
     )
 
+# Hedging: if a model hasn't answered after HEDGE_DELAY_MS, start the next
+# candidate alongside it and take whichever succeeds first.
+HEDGE_DELAY_MS = int(os.environ.get("GROQ_HEDGE_DELAY_MS", "800"))
+_MODEL_DENY_TTL = 60 * 60  # skip a rejected (e.g. decommissioned) model for an hour
+_MODEL_DENY: Dict[str, float] = {}  # model -> time.monotonic() expiry, per process
+_LLM_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="groq-hedge")
+
+def _invoke_model(model: str, messages: list) -> str:
+    try:
+        return _new_chatgroq(model).invoke(messages).content
+    except Exception as e:
+        # 400s naming the model (model_decommissioned, model_not_found) won't fix themselves
+        if groq and isinstance(e, groq.BadRequestError) and "model" in str(e).lower():
+            _MODEL_DENY[model] = time.monotonic() + _MODEL_DENY_TTL
+        raise
+
 def _call_llm(messages: list) -> str:
     """
-    Try models in MODEL_CANDIDATES one by one. If a model is decommissioned or errors,
-    fall through to the next. If no key or all fail, raise RuntimeError.
+    Run MODEL_CANDIDATES as hedged requests: the first model starts at once, and
+    each HEDGE_DELAY_MS without an answer (or any failure) starts the next one.
+    The first successful reply wins; still-queued attempts are cancelled. If no
+    key or all fail, raise RuntimeError.
     """
     if not _llm_available():
         raise RuntimeError("GROQ_API_KEY not configured")
 
+    now = time.monotonic()
+    models = list(dict.fromkeys(MODEL_CANDIDATES))  # env override may repeat a default
+    live = [m for m in models if _MODEL_DENY.get(m, 0) <= now] or models
+    queue = iter(live)
+    delay = max(HEDGE_DELAY_MS, 0) / 1000.0
+
+    pending = set()
+    def _launch() -> bool:
+        m = next(queue, None)
+        if m is None:
+            return False
+        pending.add(_LLM_POOL.submit(_invoke_model, m, messages))
+        return True
+
     last_err = None
-    for m in MODEL_CANDIDATES:
-        try:
-            llm = _new_chatgroq(m)
-            return llm.invoke(messages).content
-        except Exception as e:
-            # If Groq returns 400 model_decommissioned, try next model
-            if groq and isinstance(e, groq.BadRequestError):
+    more = _launch()
+    while pending:
+        done, _ = wait(pending, timeout=delay if more else None, return_when=FIRST_COMPLETED)
+        if not done:
+            more = _launch()  # primary is slow: hedge with the next candidate
+            continue
+        for f in done:
+            pending.discard(f)
+            try:
+                out = f.result()
+            except Exception as e:
                 last_err = e
+                more = _launch()  # failed outright: next candidate, no waiting
                 continue
-            last_err = e
-            continue
+            for other in pending:
+                other.cancel()  # only stops ones not yet started; running calls finish unread
+            return out
     # If we got here, every model failed
     raise RuntimeError(f"All Groq models failed. Last error: {last_err}")
 
@@ -116,34 +156,43 @@ def _now_iso() -> str:
 
 # ================== Tiny text utils (no regex) ==================
 _PUNC = dict.fromkeys(map(ord, '.,;:!?"“”’\'`()[]{}<>|@#$%^&*_+=~\\/'), None)
+_PUNC_ASCII = b'.,;:!?"\'`()[]{}<>|@#$%^&*_+=~\\/'  # _PUNC minus the curly quotes
 def _normalize(s: str) -> str:
     return (s or "").strip()
 
 def _lower_clean(s: str) -> str:
-    return _normalize(s).lower().translate(_PUNC)
+    s = _normalize(s)
+    if s.isascii():
+        # bytes.lower/translate(delete=) are table lookups, several times faster than
+        # str.translate with a dict; same result for ASCII input
+        return s.encode("ascii").lower().translate(None, _PUNC_ASCII).decode("ascii")
+    return s.lower().translate(_PUNC)
 
 def _tokens(s: str) -> List[str]:
     return [t for t in _lower_clean(s).split() if t]
 
 def _char_ngrams(s: str, n: int = 3) -> Counter:
     s2 = _lower_clean(s)
-    grams: List[str] = []
     L = len(s2)
     if L == 0: return Counter()
     if L < n: return Counter([s2])
-    for i in range(L - n + 1):
-        grams.append(s2[i:i+n])
-    return Counter(grams)
+    # one comprehension straight into Counter's C counting loop (no per-gram append calls)
+    return Counter([s2[i:i+n] for i in range(L - n + 1)])
 
-def _cosine(a: Counter, b: Counter) -> float:
+def _vec_norm(v: Counter) -> float:
+    return math.sqrt(sum(c*c for c in v.values()))
+
+def _cosine(a: Counter, b: Counter, na: Optional[float] = None, nb: Optional[float] = None) -> float:
+    """Cosine of two n-gram Counters; pass precomputed norms (LexItem.norm) to skip recomputing them."""
     if not a or not b: return 0.0
-    dot = 0.0
-    for k, va in a.items():
-        vb = b.get(k)
-        if vb: dot += va * vb
-    na = math.sqrt(sum(v*v for v in a.values()))
-    nb = math.sqrt(sum(v*v for v in b.values()))
+    if na is None: na = _vec_norm(a)
+    if nb is None: nb = _vec_norm(b)
     if na == 0 or nb == 0: return 0.0
+    small, big = (a, b) if len(a) <= len(b) else (b, a)
+    dot = 0
+    for k, v in small.items():
+        w = big.get(k)
+        if w: dot += v * w
     return dot / (na * nb)
 
 # ================== Memory ==================
@@ -226,21 +275,38 @@ def _append_turn(st: State, role: str, text: str):
 
 # ================== Taxonomy index (DB-driven) ==================
 class LexItem:
-    def __init__(self, kind: str, key: str, text: str):
+    def __init__(self, kind: str, key: str, text: str, vec: Optional[Counter] = None):
         self.kind = kind
         self.key = key
         self.text = text
-        self.vec = _char_ngrams(text)
+        self.vec = _char_ngrams(text) if vec is None else vec
+        self.norm = _vec_norm(self.vec)
+
+_LEX_KEY = f"{CACHE_NS}:lex"
+_LEX_VER_KEY = f"{CACHE_NS}:lex:ver"
+# Renames/adds/deletes invalidate via signals, but a delete on the per-process LocMemCache
+# only reaches this worker; shared_cache_ttl() caps the others' staleness there.
+_LEX_TTL = 60 * 60
+
+def invalidate_lexicon() -> None:
+    """Drop the cached lexicon; the next lookup (in any worker) rebuilds it from the DB."""
+    global _LEX_STATE
+    for k in (_LEX_KEY, _LEX_VER_KEY):
+        try:
+            cache.delete(k)
+        except Exception:
+            pass
+        _INPROC.pop(k, None)
+    state = _LEX_STATE
+    if state is not None:
+        _LEX_STATE = (state[0], state[1], float("-inf"))  # this worker re-checks right away
 
 def _load_lexicon() -> List[LexItem]:
-    ck = f"{CACHE_NS}:lex"
-    cached = _cget(ck)
+    cached = _cget(_LEX_KEY)
     if cached:
         out: List[LexItem] = []
         for row in cached:
-            li = LexItem(row["kind"], row["key"], row["text"])
-            li.vec = Counter(row["vec"])
-            out.append(li)
+            out.append(LexItem(row["kind"], row["key"], row["text"], Counter(row["vec"])))
         return out
 
     items: List[LexItem] = []
@@ -252,19 +318,79 @@ def _load_lexicon() -> List[LexItem]:
         items.append(LexItem("product", p["product_id"], p.get("title") or ""))
 
     serial = [{"kind": i.kind, "key": i.key, "text": i.text, "vec": dict(i.vec)} for i in items]
-    _cset(ck, serial, ttl=300)  # cache for 5 minutes (was 60s)
+    _cset(_LEX_KEY, serial, ttl=shared_cache_ttl(_LEX_TTL))
+    _cset(_LEX_VER_KEY, _new_id(), ttl=shared_cache_ttl(_LEX_TTL))  # lets workers reuse their built index
     return items
 
+class _LexIndex:
+    """
+    Inverted index over the lexicon's n-gram vectors. Scoring a query is a
+    sparse matrix-vector product: only items sharing a gram with the query are
+    touched, instead of a full _cosine() pass over every item.
+    """
+    def __init__(self, items: List[LexItem]):
+        self.items = items
+        self.norms = [it.norm for it in items]
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for idx, it in enumerate(items):
+            for g, c in it.vec.items():
+                postings.setdefault(g, []).append((idx, c))
+        self.postings = postings
+
+    def nearest(self, qv: Counter, k: int) -> List[LexItem]:
+        qn = _vec_norm(qv)
+        if qn == 0: return []
+        dots: Dict[int, int] = {}
+        get = dots.get
+        for g, qc in qv.items():
+            for idx, c in self.postings.get(g, ()):
+                dots[idx] = get(idx, 0) + qc * c
+        norms = self.norms
+        scored = [(dot / (qn * norms[idx]), idx) for idx, dot in dots.items() if dot and norms[idx]]
+        # top-k without a full sort; ties keep lexicon order like the old stable sort
+        best = heapq.nlargest(k, scored, key=lambda x: (x[0], -x[1]))
+        return [self.items[idx] for _, idx in best]
+
+# Per-worker lexicon index as one (version, index, checked_at) tuple, swapped whole so
+# readers never see a half-updated pair. Only one thread rebuilds; while it does,
+# the others keep answering from the previous index instead of queueing behind it.
+_LEX_STATE: Optional[Tuple[str, _LexIndex, float]] = None
+_LEX_LOCK = threading.Lock()
+_LEX_RECHECK = 5.0  # seconds between version-key reads (other workers' invalidations)
+
+def _lex_state() -> Tuple[str, _LexIndex]:
+    global _LEX_STATE
+    state = _LEX_STATE
+    now = time.monotonic()
+    if state is not None and now - state[2] < _LEX_RECHECK:
+        return state[0], state[1]
+    ver = _cget(_LEX_VER_KEY)
+    if state is not None and ver is not None and ver == state[0]:
+        _LEX_STATE = (state[0], state[1], now)
+        return state[0], state[1]
+
+    # stale or cold: block only when there is nothing to serve yet
+    if not _LEX_LOCK.acquire(blocking=state is None):
+        return state[0], state[1]
+    try:
+        cur = _LEX_STATE
+        if cur is not None and cur is not state:
+            return cur[0], cur[1]  # another thread rebuilt while we waited
+        items = _load_lexicon()
+        ver = _cget(_LEX_VER_KEY)
+        if ver is None:
+            ver = _new_id()
+            _cset(_LEX_VER_KEY, ver, ttl=shared_cache_ttl(_LEX_TTL))
+        index = _LexIndex(items)
+        _LEX_STATE = (ver, index, time.monotonic())
+        return ver, index
+    finally:
+        _LEX_LOCK.release()
+
 def _nearest_terms(query: str, k: int = 5) -> List[LexItem]:
     qv = _char_ngrams(query)
     if not qv: return []
-    best: List[Tuple[float, LexItem]] = []
-    for it in _load_lexicon():
-        sc = _cosine(qv, it.vec)
-        if sc > 0:
-            best.append((sc, it))
-    best.sort(key=lambda x: x[0], reverse=True)
-    return [it for _, it in best[:k]]
+    return _lex_state()[1].nearest(qv, k)
 
 # ================== Tools (deterministic) ==================
 def tool_clock(_: str = "") -> str:
@@ -391,6 +517,8 @@ def _build_product_qs(query_text: str, pmin: Optional[float], pmax: Optional[flo
     return qs
 
 
+_ECOM_TTL = 300  # 5 minutes for price/stock changes; lexicon changes retire keys via the version
+
 def tool_ecommerce(query_text: str) -> str:
     """
     Returns JSON with:
@@ -420,7 +548,38 @@ def tool_ecommerce(query_text: str) -> str:
             return None
 
     pmin, pmax = _extract_budget(query_text)
-    qs = _build_product_qs(query_text, pmin, pmax)[:30]
+
+    # Same cleaned text + budget against the same lexicon build -> same payload
+    lex_ver, _ = _lex_state()
+    qh = hashlib.blake2b(_lower_clean(query_text).encode("utf-8"), digest_size=8).hexdigest()
+    ck = f"{CACHE_NS}:ecom:{qh}:{pmin}:{pmax}:{lex_ver}"
+    hit = _cget(ck)
+    if hit is not None:
+        return hit
+
+    # Variants (+ their combinations), shipping and inventory ride along with the
+    # product query: one JOIN plus two prefetches instead of a query per table.
+    qs = (
+        _build_product_qs(query_text, pmin, pmax)
+        .select_related("shippinginfo", "productinventory")
+        .prefetch_related(
+            Prefetch(
+                "productvariant_set",
+                queryset=ProductVariant.objects.only(
+                    "variant_id", "product_id", "size", "color", "printing_methods"
+                ).prefetch_related(
+                    Prefetch(
+                        "variantcombination_set",
+                        queryset=VariantCombination.objects.only("combo_id", "variant_id", "price_override"),
+                    )
+                ),
+            )
+        )
+        .only(
+            "product_id", "title", "price", "discounted_price", "order",
+            "shippinginfo__processing_time", "productinventory__stock_status",
+        )[:30]
+    )
 
     # --- Visible categories
     visible_cats_qs = Category.objects.filter(status="visible").order_by("order")
@@ -433,50 +592,18 @@ def tool_ecommerce(query_text: str) -> str:
     ).distinct().order_by("order")
     subcategories = [{"name": s.name or "", "description": getattr(s, "description", "") or ""} for s in visible_subs_qs]
 
-    # Prefetch maps
-    product_ids = list(qs.values_list("product_id", flat=True))
-
-    # product_id -> [variants]
-    variants_by_product = {}
-    for v in ProductVariant.objects.filter(product_id__in=product_ids):
-        variants_by_product.setdefault(v.product_id, []).append(v)
-
-    # product_id -> ShippingInfo
-    shipping_by_product = {s.product_id: s for s in ShippingInfo.objects.filter(product_id__in=product_ids)}
-
-    # product_id -> ProductInventory
-    inventory_by_product = {inv.product_id: inv for inv in ProductInventory.objects.filter(product_id__in=product_ids)}
-
-    # Gather overrides
-    all_variant_ids = []
-    for vlist in variants_by_product.values():
-        for v in vlist:
-            all_variant_ids.append(v.variant_id)
-
-    overrides_by_product = {pid: [] for pid in product_ids}
-    if all_variant_ids:
-        # map variant -> product
-        variant_to_product = {}
-        for pid, vlist in variants_by_product.items():
-            for v in vlist:
-                variant_to_product[v.variant_id] = pid
-
-        for combo in VariantCombination.objects.filter(variant_id__in=all_variant_ids):
-            pid = variant_to_product.get(combo.variant_id)
-            if pid:
-                ov = _to_decimal(combo.price_override)
-                if ov is not None:
-                    overrides_by_product[pid].append(ov)
-
     # Build items
     items = []
     for p in qs:
-        pid = p.product_id
-
         sizes = set()
         colors = set()
         printing_set = set()
-        for v in variants_by_product.get(pid, []):
+        overrides = []
+        for v in p.productvariant_set.all():
+            for combo in v.variantcombination_set.all():
+                ov = _to_decimal(combo.price_override)
+                if ov is not None:
+                    overrides.append(ov)
             if v.size:
                 sizes.add(v.size)
             if v.color:
@@ -486,7 +613,7 @@ def tool_ecommerce(query_text: str) -> str:
                     if pm:
                         printing_set.add(str(pm))
 
-        ship = shipping_by_product.get(pid)
+        ship = getattr(p, "shippinginfo", None)
         processing_time = ship.processing_time if ship else ""
 
         # price candidates
@@ -497,8 +624,7 @@ def tool_ecommerce(query_text: str) -> str:
             candidates.append(base_price)
         if disc_price is not None:
             candidates.append(disc_price)
-        for ov in overrides_by_product.get(pid, []):
-            candidates.append(ov)
+        candidates.extend(overrides)
 
         effective_price = None
         if candidates:
@@ -507,7 +633,7 @@ def tool_ecommerce(query_text: str) -> str:
             if valid:
                 effective_price = min(valid)
 
-        inv = inventory_by_product.get(pid)
+        inv = getattr(p, "productinventory", None)
         stock_status = getattr(inv, "stock_status", "") if inv else ""
 
         items.append({
@@ -523,12 +649,14 @@ def tool_ecommerce(query_text: str) -> str:
     text = "Here are some products you might like" if items else \
            "No matching visible products. Try different terms or a broader budget."
 
-    return json.dumps({
+    out = json.dumps({
         "text": text,
         "categories": categories,
         "subcategories": subcategories,
         "items": items
     }, default=str)
+    _cset(ck, out, ttl=_ECOM_TTL)
+    return out
 
 # Expose tools to the agent
 TOOLS: List[Tool] = [
@@ -585,6 +713,24 @@ def _parse_json(text: str, fallback: dict) -> dict:
     return fallback
 
 # ================== Chains (Groq-driven) ==================
+_INTENT_TTL = 60 * 60  # classifier output only depends on the message text; short so prompt edits roll out
+
+def _fold(s: str) -> str:
+    # case and spacing only: punctuation carries meaning ("under 10.5" vs "under 105")
+    return " ".join(s.strip().lower().split())
+
+def _load_greetings() -> frozenset:
+    path = os.path.join(os.path.dirname(__file__), "greetings.txt")
+    with open(path, encoding="utf-8") as fh:
+        return frozenset(_fold(line) for line in fh if line.strip() and not line.startswith("#"))
+
+# Bare greetings never need the classifier; the whole message must be one of them
+_GREETINGS = _load_greetings()
+_GREETING_INTENT = {"intent": "greetings", "focus": "greeting", "relevant": True, "price_min": None, "price_max": None}
+
+def _intent_cache_key(s: str) -> str:
+    return f"{CACHE_NS}:intent:{hashlib.blake2b(_fold(s).encode('utf-8'), digest_size=8).hexdigest()}"
+
 def llm_intent_and_focus(user_text: str, st: State) -> dict:
     """
     Multilingual, LLM-driven intent classifier.
@@ -608,6 +754,13 @@ def llm_intent_and_focus(user_text: str, st: State) -> dict:
         # default to ecommerce if we can't be sure
         return {"intent": "ecommerce", "focus": "start", "relevant": True, "price_min": None, "price_max": None}
 
+    if _fold(s).strip("!?.,¡¿ ") in _GREETINGS:
+        return dict(_GREETING_INTENT)
+    ck = _intent_cache_key(s)
+    hit = _cget(ck)
+    if hit is not None:
+        return dict(hit)
+
     try:
         sys = SystemMessage(content=(
             "You are an intent classifier for a shopping assistant. Users may speak ANY language.\n"
@@ -657,6 +810,7 @@ def llm_intent_and_focus(user_text: str, st: State) -> dict:
         if pmn is not None and pmx is not None and pmn > pmx:
             data["price_min"], data["price_max"] = pmx, pmn
 
+        _cset(ck, data, ttl=_INTENT_TTL)
         return data
 
     except Exception:
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:23
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_backend_final', '0047_recentlydeleteditem'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attributesubcategory',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='attr_name_lc_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Index AttributeSubCategory.subcategory_ids for containment lookups.
+#
+# The list endpoint filters with `subcategory_ids__contains=[sub_id]`.
+# - MySQL (8.0.17+): a multi-valued index backs JSON_CONTAINS / MEMBER OF.
+# - PostgreSQL: a GIN index backs jsonb `@>`.
+# Other backends (e.g. SQLite in local dev) have no equivalent; no-op there.
+
+from django.db import migrations
+
+TABLE = "admin_backend_final_attributesubcategory"
+INDEX = "attr_subids_idx"
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "mysql":
+        schema_editor.execute(
+            f"CREATE INDEX {INDEX} ON {TABLE} ((CAST(subcategory_ids AS CHAR(100) ARRAY)))"
+        )
+    elif vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX {INDEX} ON {TABLE} USING GIN (subcategory_ids)"
+        )
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "mysql":
+        schema_editor.execute(f"DROP INDEX {INDEX} ON {TABLE}")
+    elif vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_backend_final', '0048_attributesubcategory_attr_name_lc_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
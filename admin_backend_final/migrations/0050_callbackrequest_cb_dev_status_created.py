@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_backend_final', '0049_attributesubcategory_subcategory_ids_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='callbackrequest',
+            index=models.Index(fields=['device_uuid', 'status', '-created_at'], name='cb_dev_status_created'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_backend_final', '0050_callbackrequest_cb_dev_status_created'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='categorysubcategorymap',
+            index=models.Index(fields=['subcategory', 'category'], name='csm_sub_cat_idx'),
+        ),
+    ]
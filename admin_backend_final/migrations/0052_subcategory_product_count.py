@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:02
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_product_count(apps, schema_editor):
+    SubCategory = apps.get_model('admin_backend_final', 'SubCategory')
+    ProductSubCategoryMap = apps.get_model('admin_backend_final', 'ProductSubCategoryMap')
+    counts = (
+        ProductSubCategoryMap.objects.filter(subcategory=OuterRef('pk'))
+        .order_by().values('subcategory').annotate(c=Count('pk')).values('c')
+    )
+    SubCategory.objects.update(product_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_backend_final', '0051_categorysubcategorymap_csm_sub_cat_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subcategory',
+            name='product_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_product_count, migrations.RunPython.noop),
+    ]
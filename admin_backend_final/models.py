@@ -5,6 +5,7 @@ from django.conf import settings # for AUTH_USER_MODEL-safe FKs
 from decimal import Decimal, ROUND_HALF_UP
 from django.utils import timezone 
 from django.utils.text import slugify 
+from django.db.models.functions import Lower
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from datetime import timedelta
@@ -117,6 +118,8 @@ class SubCategory(models.Model):
     caption = models.CharField(max_length=255, blank=True, null=True)
     description = models.TextField(blank=True, null=True)
     order = models.PositiveIntegerField(default=0)
+    # Denormalised ProductSubCategoryMap count; kept in sync by signals.py
+    product_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ["order", "name"]
@@ -137,6 +140,8 @@ class CategorySubCategoryMap(models.Model):
         indexes = [
             models.Index(fields=["category"]),
             models.Index(fields=["subcategory"]),
+            # subcategory -> its category ids, answered from the index alone
+            models.Index(fields=["subcategory", "category"], name="csm_sub_cat_idx"),
         ]
         unique_together = ("category", "subcategory")
 
@@ -188,6 +193,12 @@ class AttributeSubCategory(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # list endpoint orders by LOWER(name)
+            models.Index(Lower("name"), name="attr_name_lc_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -789,6 +800,8 @@ class CallbackRequest(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["preferred_callback"]),
             models.Index(fields=["event_datetime"]),
+            # show-all-callback: filter device (+ status), newest first
+            models.Index(fields=["device_uuid", "status", "-created_at"], name="cb_dev_status_created"),
         ]
 
     def __str__(self) -> str:
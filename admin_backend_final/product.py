@@ -29,6 +29,7 @@ from .utilities import (
 )
 from .models import *
 from .permissions import FrontendOnlyPermission
+from .category import invalidate_catalog_cache, refresh_product_counts_on_commit
 
 logger = logging.getLogger(__name__)
 
@@ -1438,6 +1439,9 @@ class LinkProductToSubcategoriesAPIView(APIView):
             to_add = [ProductSubCategoryMap(product=product, subcategory=s) for s in valid_subs if s.subcategory_id in to_add_ids]
             if to_add:
                 ProductSubCategoryMap.objects.bulk_create(to_add, ignore_conflicts=True)
+                # bulk_create sends no post_save; merges with the removals' refresh
+                refresh_product_counts_on_commit(to_add_ids)
+                transaction.on_commit(invalidate_catalog_cache)
 
             removed = 0
             if to_remove_ids:
@@ -0,0 +1,43 @@
+# admin_backend_final/renderers.py
+from datetime import date, datetime, time
+import json
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson  # pip install orjson
+except Exception:
+    orjson = None
+
+
+def _default(o):
+    # Same shapes orjson produces natively: ISO-8601 datetimes, str() for the rest
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    return str(o)
+
+
+def dumps(data) -> bytes:
+    """
+    Encode to compact JSON bytes. orjson when installed (C, ~2-5x faster),
+    stdlib json otherwise. datetimes/UUIDs/Decimals need no pre-conversion.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """Decode JSON from bytes/str; orjson takes bytes directly (no .decode() pass)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OrjsonRenderer(JSONRenderer):
+    """Drop-in JSONRenderer that encodes via dumps() above."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return dumps(data)
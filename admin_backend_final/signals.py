@@ -1,13 +1,15 @@
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils.timezone import now
-from django.db import models
+from django.db import models, transaction
 from decimal import Decimal
 from uuid import UUID
 from .models import Admin, Notification, DashboardSnapshot, SiteSettings, RecentlyDeletedItem
 import uuid
 from django.contrib.auth.signals import user_logged_in
 from .models import Product, Orders, BlogPost, Category, SubCategory, ProductTestimonial
+from .models import CategoryImage, SubCategoryImage, CategorySubCategoryMap, ProductSubCategoryMap, Image
+from .category import invalidate_catalog_cache, refresh_product_counts, refresh_product_counts_on_commit
 from django.contrib.auth.signals import user_logged_out
 from django.apps import apps
 from django.db.models.fields.files import FieldFile
@@ -109,6 +111,41 @@ def notify_subcategory_created_or_updated(sender, instance, created, **kwargs):
     create_admin_notification(message, "SubCategory", instance.subcategory_id)
 
 
+# Any write to a row the category/subcategory listings render retires the cached copies
+def invalidate_catalog_on_change(sender, **kwargs):
+    transaction.on_commit(invalidate_catalog_cache)
+
+for _model in (Category, SubCategory, CategoryImage, SubCategoryImage,
+               CategorySubCategoryMap, ProductSubCategoryMap, Image):
+    post_save.connect(invalidate_catalog_on_change, sender=_model, dispatch_uid=f"catalog_cache_save_{_model.__name__}")
+    post_delete.connect(invalidate_catalog_on_change, sender=_model, dispatch_uid=f"catalog_cache_delete_{_model.__name__}")
+
+# SubCategory.product_count: recomputed (not +/-1) so restores from the trash bin,
+# which re-insert a stale snapshot of the subcategory, converge on the true count.
+# Batched per transaction: a bulk map delete fires post_delete once per row
+@receiver(post_save, sender=ProductSubCategoryMap)
+@receiver(post_delete, sender=ProductSubCategoryMap)
+def sync_subcategory_product_count(sender, instance, **kwargs):
+    refresh_product_counts_on_commit([instance.subcategory_id])
+
+# Chat lexicon (category/subcategory names, product titles): rebuilt on the next chat
+# lookup after a row it indexes is added, renamed or deleted
+def invalidate_chat_lexicon(sender, update_fields=None, **kwargs):
+    if update_fields is not None and not {"name", "title"} & set(update_fields):
+        return  # e.g. Product.save(update_fields=["rating"])
+    from .chat import invalidate_lexicon  # deferred: chat pulls in the LLM stack
+    transaction.on_commit(invalidate_lexicon)
+
+for _model in (Category, SubCategory, Product):
+    post_save.connect(invalidate_chat_lexicon, sender=_model, dispatch_uid=f"chat_lexicon_save_{_model.__name__}")
+    post_delete.connect(invalidate_chat_lexicon, sender=_model, dispatch_uid=f"chat_lexicon_delete_{_model.__name__}")
+
+@receiver(post_save, sender=SubCategory)
+def init_subcategory_product_count(sender, instance, created, **kwargs):
+    if created:
+        refresh_product_counts([instance.subcategory_id])
+
+
 @receiver(user_logged_in)
 def notify_user_login(sender, request, user, **kwargs):
     from .models import Notification
@@ -1,3 +1,487 @@
-from django.test import TestCase
+import importlib.util
+import json
+import shutil
+import unittest
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib import admin
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import QuerySet
+from django.middleware.csrf import CsrfViewMiddleware, _unmask_cipher_token
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import path
+from rest_framework.test import APIRequestFactory
+
+from .auth_views import csrf
+from .callback import EditCallbackAPIView, SaveCallbackAPIView, ShowAllCallbackAPIView, _coerce_guests
+from .category import (
+    CATALOG_CACHE_TTL, DeleteCategoryAPIView, DeleteSubCategoryAPIView, SaveCategoryAPIView, ShowCategoryAPIView,
+)
+from .blog import (
+    BlogImageFileView, DeleteBlogsAPIView, SaveBlogAPIView, ShowSpecificBlogAPIView, ensure_unique_slug,
+)
+from .models import (
+    BlogImage, BlogPost, CallbackRequest, Category, CategorySubCategoryMap, Image, Product,
+    ProductSubCategoryMap, SubCategory,
+)
+from .permissions import FRONTEND_KEY
+from .utilities import shared_cache_ttl
+
+
+# Minimal URLconf for views that reverse() their siblings (ROOT_URLCONF=__name__)
+urlpatterns = [
+    path("api/blog/<str:blog_id>/image/<str:image_id>/", BlogImageFileView.as_view(), name="blog_image_file"),
+]
+
+class CsrfEndpointTests(TestCase):
+    """GET /api/csrf/ without @ensure_csrf_cookie: the global middleware sets the cookie."""
+
+    def test_returns_masked_token_and_sets_cookie(self):
+        request = RequestFactory().get("/api/csrf/")
+        response = CsrfViewMiddleware(csrf)(request)
+
+        token = json.loads(response.content)["csrfToken"]
+        cookie = response.cookies["csrftoken"].value
+        self.assertEqual(len(token), 64)
+        self.assertNotEqual(token, cookie)  # masked, not the raw secret
+        self.assertEqual(_unmask_cipher_token(token), cookie)
+
+
+class EnsureUniqueSlugTests(TestCase):
+    def _post(self, slug):
+        return BlogPost.objects.create(blog_id=f"b-{slug}", title=slug, slug=slug)
+
+    def test_free_slug_is_returned_as_is(self):
+        self.assertEqual(ensure_unique_slug("Hello World"), "hello-world")
+
+    def test_probes_from_two(self):
+        self._post("foo")
+        self._post("foo-2")
+        self.assertEqual(ensure_unique_slug("foo"), "foo-3")
+
+    def test_numeric_looking_title_does_not_skip_ahead(self):
+        self._post("foo")
+        self._post("foo-2024")
+        self.assertEqual(ensure_unique_slug("foo"), "foo-2")
+
+    def test_own_slug_is_not_a_conflict(self):
+        post = self._post("foo")
+        self.assertEqual(ensure_unique_slug("foo", exclude_blog_id=post.blog_id), "foo")
+
+
+class DeleteBlogsBodyTests(TestCase):
+    def _delete(self, body, content_type):
+        request = APIRequestFactory().post(
+            "/api/delete-blogs/", body, content_type=content_type, HTTP_X_FRONTEND_KEY=FRONTEND_KEY
+        )
+        return DeleteBlogsAPIView.as_view()(request)
+
+    def test_json_body(self):
+        BlogPost.objects.create(blog_id="b1", title="t", slug="t")
+        response = self._delete('{"ids": ["b1"]}', "application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(BlogPost.objects.filter(blog_id="b1").exists())
+
+    def test_text_plain_body_is_still_read_as_json(self):
+        BlogPost.objects.create(blog_id="b1", title="t", slug="t")
+        response = self._delete('{"ids": ["b1"]}', "text/plain;charset=UTF-8")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(BlogPost.objects.filter(blog_id="b1").exists())
+
+    def test_unparseable_body_is_treated_as_empty(self):
+        response = self._delete("not json", "text/plain")
+        self.assertEqual(response.status_code, 400)
+
+
+class SaveBlogSlugConflictTests(TestCase):
+    def _save(self, payload):
+        request = APIRequestFactory().post(
+            "/api/save-blog/", payload, format="json", HTTP_X_FRONTEND_KEY=FRONTEND_KEY
+        )
+        return SaveBlogAPIView.as_view()(request)
+
+    def test_taken_slug_is_resolved_on_retry(self):
+        BlogPost.objects.create(blog_id="b1", title="Foo", slug="foo")
+        response = self._save({"title": "Foo"})
+        self.assertLess(response.status_code, 300)
+        self.assertEqual(
+            sorted(BlogPost.objects.values_list("slug", flat=True)), ["foo", "foo-2"]
+        )
+
+    def test_other_integrity_errors_are_not_reported_as_slug_conflicts(self):
+        with mock.patch.object(BlogPost, "save", side_effect=IntegrityError("other constraint")):
+            with self.assertRaises(IntegrityError):
+                self._save({"title": "Foo"})
+
+
+PNG_1PX = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class BlogImageTests(TestCase):
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        media_override = override_settings(MEDIA_ROOT=media)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def _blog_with_image(self, blog_id, draft):
+        blog = BlogPost.objects.create(blog_id=blog_id, title=blog_id, slug=blog_id, draft=draft)
+        img = Image.objects.create(
+            image_id=f"img-{blog_id}", width=1, height=1,
+            image_file=SimpleUploadedFile("px.png", PNG_1PX, content_type="image/png"),
+        )
+        BlogImage.objects.create(blog=blog, image=img, is_primary=True)
+        return blog, img
+
+    def _show(self, **params):
+        request = APIRequestFactory().get("/api/show-specific-blog/", params, HTTP_X_FRONTEND_KEY=FRONTEND_KEY)
+        return ShowSpecificBlogAPIView.as_view()(request)
+
+    def _file(self, blog_id, image_id, **headers):
+        request = APIRequestFactory().get(f"/api/blog/{blog_id}/image/{image_id}/", **headers)
+        return BlogImageFileView.as_view()(request, blog_id=blog_id, image_id=image_id)
+
+    def test_show_specific_blog_embeds_data_uris_by_default(self):
+        self._blog_with_image("live", draft=False)
+        data = self._show(blog_id="live").data
+        self.assertTrue(data["thumbnail"].startswith("data:image/png;base64,"))
+        self.assertTrue(data["images"][0]["url"].startswith("data:image/png;base64,"))
+
+    def test_show_specific_blog_links_files_on_request(self):
+        self._blog_with_image("live", draft=False)
+        data = self._show(blog_id="live", image_urls="1").data
+        self.assertEqual(data["images"][0]["url"], "/api/blog/live/image/img-live/")
+
+    def test_file_endpoint_serves_live_posts_anonymously(self):
+        self._blog_with_image("live", draft=False)
+        response = self._file("live", "img-live")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(b"".join(response.streaming_content), PNG_1PX)
+
+    def test_file_endpoint_hides_drafts_from_anonymous_callers(self):
+        self._blog_with_image("wip", draft=True)
+        self.assertEqual(self._file("wip", "img-wip").status_code, 404)
+        self.assertEqual(self._file("wip", "img-wip", HTTP_X_FRONTEND_KEY=FRONTEND_KEY).status_code, 200)
+
+
+class CoerceGuestsTests(TestCase):
+    def test_accepted_values(self):
+        self.assertEqual(_coerce_guests("25"), 25)
+        self.assertEqual(_coerce_guests(25), 25)
+        self.assertEqual(_coerce_guests(25.9), 25)
+        self.assertEqual(_coerce_guests("2147483647"), 2147483647)
+
+    def test_rejected_values(self):
+        for raw in (None, "", "0", "-3", "+5", "²", "abc", 0, float("nan"), float("inf"), [], {}):
+            with self.subTest(raw=raw):
+                self.assertIsNone(_coerce_guests(raw))
+
+    def test_out_of_range_values(self):
+        for raw in ("2147483648", "1" * 11, "1" * 5000, 2 ** 31, 1e300):
+            with self.subTest(raw=raw if not isinstance(raw, str) else f"{len(raw)} digits"):
+                self.assertIsNone(_coerce_guests(raw))
+
+    def test_save_callback_with_oversized_guest_count(self):
+        request = APIRequestFactory().post("/api/save-callback/", {
+            "device_uuid": "dev-1",
+            "username": "Sam",
+            "phone_number": "+971500000000",
+            "event_type": "wedding",
+            "preferred_callback": "2030-01-01T10:00:00Z",
+            "approx_guest": "1" * 5000,
+        }, format="json", HTTP_X_FRONTEND_KEY=FRONTEND_KEY)
+        response = SaveCallbackAPIView.as_view()(request)
+        self.assertLess(response.status_code, 300)
+        self.assertIsNone(CallbackRequest.objects.get().approx_guest)
+
+
+
+class ShowAllCallbacksTests(TestCase):
+    def setUp(self):
+        for cid, device, state in (("cb-1", "dev-1", "pending"), ("cb-2", "dev-1", "completed"), ("cb-3", "dev-2", "pending")):
+            CallbackRequest.objects.create(callback_id=cid, device_uuid=device, username=cid, status=state)
+
+    def _list(self, **params):
+        request = APIRequestFactory().get("/api/show-all-callback/", params, HTTP_X_FRONTEND_KEY=FRONTEND_KEY)
+        response = ShowAllCallbackAPIView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_streams_valid_json(self):
+        self.assertEqual(sorted(cb["id"] for cb in self._list()), ["cb-1", "cb-2", "cb-3"])
+        self.assertEqual([cb["id"] for cb in self._list(device_uuid="dev-1", status="pending")], ["cb-1"])
+
+    def test_empty_result_is_an_empty_array(self):
+        self.assertEqual(self._list(device_uuid="nobody"), [])
+
+    def test_query_errors_fail_before_streaming(self):
+        request = APIRequestFactory().get("/api/show-all-callback/", HTTP_X_FRONTEND_KEY=FRONTEND_KEY)
+        with mock.patch("admin_backend_final.callback._list_sql", return_value="SELECT * FROM no_such_table"), \
+                self.assertRaises(DatabaseError), transaction.atomic():
+            ShowAllCallbackAPIView.as_view()(request)
+
+
+class EditCallbackTests(TestCase):
+    def _edit(self, payload):
+        request = APIRequestFactory().post("/api/edit-callback/", payload, format="json", HTTP_X_FRONTEND_KEY=FRONTEND_KEY)
+        return EditCallbackAPIView.as_view()(request)
+
+    def test_updates_and_returns_the_row(self):
+        CallbackRequest.objects.create(callback_id="cb-1", username="Sam")
+        response = self._edit({"id": "cb-1", "notes": "call after 5"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["notes"], "call after 5")
+
+    def test_row_deleted_after_the_update_is_a_404(self):
+        CallbackRequest.objects.create(callback_id="cb-1", username="Sam")
+        update = QuerySet.update
+
+        def update_then_delete(qs, **changed):
+            count = update(qs, **changed)
+            CallbackRequest.objects.filter(pk="cb-1").delete()
+            return count
+
+        with mock.patch.object(QuerySet, "update", autospec=True, side_effect=update_then_delete):
+            response = self._edit({"id": "cb-1", "notes": "call after 5"})
+        self.assertEqual(response.status_code, 404)
+
+class CatalogFixtures:
+    def _category(self, cid):
+        return Category.objects.create(category_id=cid, name=cid, status="visible", created_by="t")
+
+    def _subcategory(self, sid, *parents):
+        sub = SubCategory.objects.create(subcategory_id=sid, name=sid, status="visible", created_by="t")
+        for cat in parents:
+            CategorySubCategoryMap.objects.create(category=cat, subcategory=sub)
+        return sub
+
+    def _product(self, pid, *subs):
+        product = Product.objects.create(
+            product_id=pid, title=pid, description="", price=1, discounted_price=0, tax_rate=0,
+            price_calculator="", status="active", created_by="t", created_by_type="admin",
+        )
+        for sub in subs:
+            ProductSubCategoryMap.objects.create(product=product, subcategory=sub)
+        return product
+
+    def _post(self, view, payload):
+        request = APIRequestFactory().post("/", payload, format="json", HTTP_X_FRONTEND_KEY=FRONTEND_KEY)
+        return view.as_view()(request)
+
+
+class DeleteSubCategoryTests(CatalogFixtures, TestCase):
+    def setUp(self):
+        cat = self._category("c")
+        self.a, self.b, self.c = (self._subcategory(s, cat) for s in ("a", "b", "c"))
+        self._product("only-a", self.a)
+        self._product("a-and-b", self.a, self.b)
+        self._product("a-and-c", self.a, self.c)
+
+    def test_asks_for_confirmation_before_deleting_anything(self):
+        response = self._post(DeleteSubCategoryAPIView, {"ids": ["a", "b"]})
+        self.assertTrue(response.data["confirm"])
+        self.assertEqual(SubCategory.objects.count(), 3)
+        self.assertEqual(Product.objects.count(), 3)
+
+    def test_batch_delete_keeps_products_linked_outside_the_batch(self):
+        response = self._post(DeleteSubCategoryAPIView, {"ids": ["a", "b", "a"], "confirm": True})
+        self.assertTrue(response.data["success"])
+        self.assertEqual(list(SubCategory.objects.values_list("pk", flat=True)), ["c"])
+        self.assertEqual(list(Product.objects.values_list("pk", flat=True)), ["a-and-c"])
+        self.assertEqual(
+            list(ProductSubCategoryMap.objects.values_list("product_id", "subcategory_id")),
+            [("a-and-c", "c")],
+        )
+
+
+class DeleteCategoryTests(CatalogFixtures, TestCase):
+    def setUp(self):
+        self.x, self.y = self._category("x"), self._category("y")
+        self._subcategory("only-x", self.x)
+        self._subcategory("x-and-y", self.x, self.y)
+
+    def test_asks_for_confirmation_before_deleting_anything(self):
+        response = self._post(DeleteCategoryAPIView, {"ids": ["x"]})
+        self.assertTrue(response.data["confirm"])
+        self.assertEqual(Category.objects.count(), 2)
+        self.assertEqual(SubCategory.objects.count(), 2)
+
+    def test_batch_delete_keeps_subcategories_with_another_parent(self):
+        response = self._post(DeleteCategoryAPIView, {"ids": ["x"], "confirm": True})
+        self.assertTrue(response.data["success"])
+        self.assertEqual(list(Category.objects.values_list("pk", flat=True)), ["y"])
+        self.assertEqual(list(SubCategory.objects.values_list("pk", flat=True)), ["x-and-y"])
+        self.assertEqual(
+            list(CategorySubCategoryMap.objects.values_list("category_id", "subcategory_id")),
+            [("y", "x-and-y")],
+        )
+
+    def test_category_without_subcategories_needs_no_confirmation(self):
+        self._category("empty")
+        response = self._post(DeleteCategoryAPIView, {"ids": ["empty"]})
+        self.assertTrue(response.data["success"])
+        self.assertFalse(Category.objects.filter(pk="empty").exists())
+
+
+class CatalogListingCacheTests(CatalogFixtures, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _names(self):
+        request = APIRequestFactory().get("/api/show-categories/", HTTP_X_FRONTEND_KEY=FRONTEND_KEY)
+        return [c["name"] for c in json.loads(ShowCategoryAPIView.as_view()(request).content)]
+
+    def test_listing_is_cached_until_a_committed_write(self):
+        self._category("first")
+        self.assertEqual(self._names(), ["first"])
+
+        self._category("uncommitted")  # on_commit never fires inside the test transaction
+        self.assertEqual(self._names(), ["first"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._category("second")
+        self.assertEqual(sorted(self._names()), ["first", "second", "uncommitted"])
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_process_local_cache_gets_a_short_ttl(self):
+        self.assertEqual(shared_cache_ttl(CATALOG_CACHE_TTL), 60)
+
+    @override_settings(CACHES={"default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://localhost:6379",
+    }})
+    def test_shared_cache_keeps_the_long_ttl(self):
+        self.assertEqual(shared_cache_ttl(CATALOG_CACHE_TTL), CATALOG_CACHE_TTL)
+
+
+class CategoryImageUploadTests(CatalogFixtures, TestCase):
+    def _save(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self._post(SaveCategoryAPIView, {"name": "Banners", "image": "data:image/png;base64,AAAA"})
+
+    def test_failed_upload_is_logged_and_reported(self):
+        with mock.patch("admin_backend_final.category.save_image", return_value=None), \
+                self.assertLogs("admin_backend_final.category", "ERROR"):
+            response = self._save()
+        self.assertEqual(response.status_code, 201)
+        self.assertIs(response.data["image_saved"], False)
+        self.assertIn("image_error", response.data)
+        self.assertTrue(Category.objects.filter(name="Banners").exists())
+
+    def test_successful_upload_is_reported(self):
+        image = Image.objects.create(image_id="img-1", width=1, height=1)
+        with mock.patch("admin_backend_final.category.save_image", return_value=image):
+            response = self._save()
+        self.assertIs(response.data["image_saved"], True)
+        self.assertNotIn("image_error", response.data)
+
+
+class ProductCountTests(CatalogFixtures, TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.a, self.b = self._subcategory("a"), self._subcategory("b")
+            for i in range(4):
+                self._product(f"p{i}", self.a, self.b)
+
+    def _counts(self):
+        return dict(SubCategory.objects.values_list("pk", "product_count"))
+
+    def test_counts_follow_map_writes(self):
+        self.assertEqual(self._counts(), {"a": 4, "b": 4})
+
+    def test_bulk_map_delete_refreshes_counts_once(self):
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            ProductSubCategoryMap.objects.filter(product_id__in=["p0", "p1", "p2"]).delete()
+        refreshes = [q for q in queries if q["sql"].startswith("UPDATE") and "product_count" in q["sql"]]
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(self._counts(), {"a": 1, "b": 1})
+
+    def test_rolled_back_savepoint_does_not_swallow_later_refreshes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    ProductSubCategoryMap.objects.filter(product_id="p0").delete()
+                    raise IntegrityError
+            except IntegrityError:
+                pass
+            ProductSubCategoryMap.objects.filter(product_id="p1", subcategory=self.a).delete()
+        self.assertEqual(self._counts(), {"a": 3, "b": 4})
+
+
+@unittest.skipUnless(importlib.util.find_spec("langchain_groq"), "chat needs the LLM stack")
+class ChatIntentCacheTests(TestCase):
+    def setUp(self):
+        from . import chat
+        self.chat = chat
+        cache.clear()
+        self.addCleanup(cache.clear)
+        for patcher in (mock.patch.object(chat, "GROQ_API_KEY", "test-key"),
+                        mock.patch.object(chat, "_call_llm", return_value='{"intent": "ecommerce", "focus": "budget"}')):
+            self.llm = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_key_ignores_case_and_spacing_but_not_punctuation(self):
+        key = self.chat._intent_cache_key
+        self.assertEqual(key("Mugs  under 50"), key(" mugs under 50 "))
+        self.assertNotEqual(key("under 10.5"), key("under 105"))
+        self.assertNotEqual(key("2+2"), key("22"))
+
+    def test_bare_greetings_skip_the_classifier(self):
+        for text in ("hi", "  Hello  there! ", "BONJOUR", "नमस्ते", "السلام عليكم"):
+            with self.subTest(text=text):
+                self.assertEqual(self.chat.llm_intent_and_focus(text, None)["intent"], "greetings")
+        self.assertEqual(self.llm.call_count, 0)
+
+    def test_greeting_inside_a_request_still_goes_to_the_classifier(self):
+        self.assertEqual(self.chat.llm_intent_and_focus("hi, mugs under 50", None)["intent"], "ecommerce")
+        self.assertEqual(self.llm.call_count, 1)
+
+    def test_repeated_message_is_classified_once(self):
+        first = self.chat.llm_intent_and_focus("Mugs under 50", None)
+        second = self.chat.llm_intent_and_focus("mugs  under 50", None)
+        self.assertEqual(first, second)
+        self.assertEqual(self.llm.call_count, 1)
+
+
+@unittest.skipUnless(importlib.util.find_spec("langchain_groq"), "chat needs the LLM stack")
+class ChatLexiconCacheTests(TestCase):
+    def _lexicon_ttls(self):
+        from . import chat
+        with mock.patch.object(chat, "_cget", return_value=None), mock.patch.object(chat, "_cset") as cset:
+            chat._load_lexicon()
+        return {call.kwargs["ttl"] for call in cset.call_args_list}
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_process_local_cache_gets_a_short_ttl(self):
+        self.assertEqual(self._lexicon_ttls(), {60})
+
+    @override_settings(CACHES={"default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://localhost:6379",
+    }})
+    def test_shared_cache_keeps_the_long_ttl(self):
+        from .chat import _LEX_TTL
+        self.assertEqual(self._lexicon_ttls(), {_LEX_TTL})
+
+
+class AdminChangelistJoinTests(TestCase):
+    def test_changelists_join_only_their_listed_relations(self):
+        from . import admin as _registrations  # noqa: F401  (registers the ModelAdmins)
+        request = RequestFactory().get("/admin/")
+        request.user = mock.Mock(is_active=True, is_staff=True, has_perm=mock.Mock(return_value=True))
+        for model, model_admin in admin.site._registry.items():
+            if model._meta.app_label != "admin_backend_final":
+                continue
+            with self.subTest(model=model.__name__):
+                query = model_admin.get_changelist_instance(request).get_queryset(request).query
+                # True means Django fell back to a bare select_related() over every FK
+                self.assertIsNot(query.select_related, True)
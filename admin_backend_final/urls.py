@@ -67,6 +67,7 @@ urlpatterns = [
     path("edit-blog/<str:blog_id>/", blog.EditBlogAPIView.as_view(), name="edit_blog"),
     path("delete-blogs/", blog.DeleteBlogsAPIView.as_view(), name="delete_blog"),
     path('show-specific-blog/', blog.ShowSpecificBlogAPIView.as_view(), name='show_specific_blog'),
+    path("blog/<str:blog_id>/image/<str:image_id>/", blog.BlogImageFileView.as_view(), name="blog_image_file"),
     path("show-all-comments/", blog.ShowAllCommentsAPIView.as_view(), name="show_all_comments"),
     path("save-comments/", blog.SaveCommentsAPIView.as_view(), name="save_comments"),
     path("show-testimonials/", testimonials.ShowTestimonialsAPIView.as_view(), name="show_testimonials"),
@@ -86,6 +87,7 @@ urlpatterns = [
     path("delete-logo/", site_details.DeleteLogoAPIView.as_view(), name="delete_logo"),
     path("delete-sitetitle-details/", site_details.DeleteSiteTitleAPIView.as_view(), name="delete_sitetitle_details"),
     path("save-callback/", callback.SaveCallbackAPIView.as_view(), name="save-callback"),
+    path("save-callback-batch/", callback.SaveCallbackBatchAPIView.as_view(), name="save-callback-batch"),
     path("edit-callback/", callback.EditCallbackAPIView.as_view(), name="edit-callback"),
     path("delete-callback/", callback.DeleteCallbackAPIView.as_view(), name="delete-callback"),
     path("show-specific-callback/", callback.ShowSpecificCallbackAPIView.as_view(), name="show-specific-callback"),
@@ -13,6 +13,7 @@ from urllib.parse import urlparse
 from urllib.request import Request, urlopen
 
 # Django
+from django.conf import settings
 from django.utils import timezone
 from django.core.files.base import ContentFile
 from django.utils.text import slugify
@@ -28,6 +29,23 @@ from .permissions import FrontendOnlyPermission
 from django.core.files.base import ContentFile
 from django.db import DatabaseError, IntegrityError
 
+# Backends whose entries live in each worker process: a delete or generation bump
+# made by one worker never reaches the copies held by the others.
+_PROCESS_LOCAL_CACHES = frozenset((
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+))
+
+def shared_cache_ttl(ttl: int, local_ttl: int = 60) -> int:
+    """
+    TTL for entries that are invalidated explicitly on write. On a shared cache
+    (Redis, as settings.py configures when REDIS_URL is set) that invalidation is
+    seen by every worker, so `ttl` can be long; on the per-process LocMemCache
+    fallback only expiry bounds how stale other workers get, so use `local_ttl`.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    return local_ttl if backend in _PROCESS_LOCAL_CACHES else ttl
+
 def format_datetime(dt):
     return dt.strftime('%d-%B-%Y-%I:%M%p')
 
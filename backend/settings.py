@@ -123,6 +123,25 @@ DATABASES = {
     }
 }
 
+# ---------------------------
+# Cache (Redis via env, in-process fallback)
+# ---------------------------
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # ---------------------------
 # Password validation
 # ---------------------------